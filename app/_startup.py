@@ -0,0 +1,11 @@
+# app/_startup.py
+# Startup import budget, shared by tests/test_startup_imports.py and
+# benchmarks/import_time.py.
+import os
+
+# Total wall budget for `import main`, in milliseconds (generous: CI machines are slow)
+IMPORT_BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", 1500))
+
+# Heavy modules that must only load on first use (or not at all)
+LAZY_MODULES = ("jose", "passlib", "bcrypt", "cryptography", "ecdsa", "rsa",
+                "pandas", "numpy", "django")
@@ -0,0 +1,179 @@
+# app/archive.py
+# Cold storage for old transactions.
+#
+# archive_before() moves every transaction dated before a month boundary out of
+# the hot `transactions` table into `transactions_archive`, and rebuilds the
+# per-month aggregates in `monthly_totals` for the months it touched. Readers
+# always query the hot table (backdated inserts still land there) and only touch
+# cold storage when the requested range starts before the archive cutoff.
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import Select, func, insert, select, tuple_
+from sqlalchemy.orm import Session
+
+from app import models
+
+_COLUMNS = ["id", "amount", "currency", "note", "tx_date", "user_id", "category_id"]
+
+
+def _month(d: date) -> str:
+    return d.strftime("%Y-%m")
+
+def _next_month(d: date) -> date:
+    return date(d.year + 1, 1, 1) if d.month == 12 else date(d.year, d.month + 1, 1)
+
+
+def month_bounds(month: str) -> Optional[Tuple[date, date]]:
+    # "YYYY-MM" -> (first day, last day), or None if malformed
+    try:
+        first = date.fromisoformat(f"{month}-01")
+    except ValueError:
+        return None
+    return first, _next_month(first) - timedelta(days=1)
+
+
+def archive_cutoff(db: Session) -> Optional[date]:
+    state = db.get(models.ArchiveState, 1)
+    return state.cutoff if state else None
+
+
+def archive_before(db: Session, before: date) -> int:
+    # archive whole months only, so monthly_totals never holds a partial month
+    cutoff = date(before.year, before.month, 1)
+    hot = models.Transaction.__table__
+    month_expr = func.strftime("%Y-%m", hot.c.tx_date)
+
+    touched = db.execute(
+        select(hot.c.user_id, month_expr).where(hot.c.tx_date < cutoff).distinct()
+    ).all()
+
+    moved = 0
+    if touched:
+        sel = select(*[hot.c[c] for c in _COLUMNS]).where(hot.c.tx_date < cutoff)
+        moved = db.execute(
+            insert(models.ArchivedTransaction.__table__).from_select(_COLUMNS, sel)
+        ).rowcount
+        db.execute(hot.delete().where(hot.c.tx_date < cutoff))
+        _rebuild_monthly_totals(db, touched)
+
+    state = db.get(models.ArchiveState, 1)
+    if state is None:
+        db.add(models.ArchiveState(id=1, cutoff=cutoff))
+    elif cutoff > state.cutoff:
+        state.cutoff = cutoff
+    db.commit()
+    return moved
+
+
+def _rebuild_monthly_totals(db: Session, user_months: Iterable[Tuple[int, str]]) -> None:
+    keys = list(user_months)
+    mt = models.MonthlyTotal.__table__
+    arc = models.ArchivedTransaction.__table__
+    month_expr = func.strftime("%Y-%m", arc.c.tx_date)
+
+    db.execute(mt.delete().where(tuple_(mt.c.user_id, mt.c.month).in_(keys)))
+    agg = (
+        select(arc.c.user_id, month_expr, arc.c.category_id, func.sum(arc.c.amount))
+        .where(tuple_(arc.c.user_id, month_expr).in_(keys))
+        .group_by(arc.c.user_id, month_expr, arc.c.category_id)
+    )
+    db.execute(insert(mt).from_select(["user_id", "month", "category_id", "total"], agg))
+
+
+def _cold_range(db: Session, start: Optional[date], end: Optional[date]) -> Optional[Tuple[Optional[date], date]]:
+    # the part of [start, end] that lives in the archive, or None if it doesn't reach it
+    cutoff = archive_cutoff(db)
+    if cutoff is None or (start is not None and start >= cutoff):
+        return None
+    cold_end = cutoff - timedelta(days=1)
+    if end is not None:
+        cold_end = min(end, cold_end)
+    if start is not None and start > cold_end:
+        return None
+    return start, cold_end
+
+
+def cold_totals_by_category(
+    db: Session, user_id: int, start: Optional[date], end: Optional[date]
+) -> Dict[int, float]:
+    rng = _cold_range(db, start, end)
+    if rng is None:
+        return {}
+    start, cold_end = rng
+    A = models.ArchivedTransaction
+    M = models.MonthlyTotal
+    totals: Dict[int, float] = defaultdict(float)
+
+    def add_raw(lo: Optional[date], hi: date):
+        q = db.query(A.category_id, func.sum(A.amount)).filter(A.user_id == user_id, A.tx_date <= hi)
+        if lo is not None:
+            q = q.filter(A.tx_date >= lo)
+        for cid, total in q.group_by(A.category_id):
+            totals[cid] += float(total)
+
+    # whole months come from monthly_totals, ragged edges from the raw archive
+    full_start = start if start is None or start.day == 1 else _next_month(start)
+    after_end = cold_end + timedelta(days=1)
+    full_end = after_end if after_end.day == 1 else date(cold_end.year, cold_end.month, 1)  # exclusive
+
+    if full_start is None or full_start < full_end:
+        q = db.query(M.category_id, func.sum(M.total)).filter(
+            M.user_id == user_id, M.month < _month(full_end)
+        )
+        if full_start is not None:
+            q = q.filter(M.month >= _month(full_start))
+        for cid, total in q.group_by(M.category_id):
+            totals[cid] += float(total)
+        if full_start is not None and start < full_start:
+            add_raw(start, full_start - timedelta(days=1))
+        if full_end <= cold_end:
+            add_raw(full_end, cold_end)
+    else:
+        add_raw(start, cold_end)
+    return dict(totals)
+
+
+def cold_total(
+    db: Session,
+    user_id: int,
+    start: Optional[date],
+    end: Optional[date],
+    category_type: str,
+    ancestor_id: Optional[int] = None,
+) -> float:
+    # archived spend of one type, optionally limited to a category subtree
+    by_cat = cold_totals_by_category(db, user_id, start, end)
+    if not by_cat:
+        return 0.0
+    q = db.query(models.Category.id).filter(
+        models.Category.id.in_(by_cat), models.Category.type == category_type
+    )
+    if ancestor_id is not None:
+        q = q.join(
+            models.CategoryClosure, models.CategoryClosure.descendant_id == models.Category.id
+        ).filter(models.CategoryClosure.ancestor_id == ancestor_id)
+    return sum(by_cat[cid] for (cid,) in q)
+
+
+def cold_transactions(
+    db: Session,
+    user_id: int,
+    category_id: Optional[int],
+    start: Optional[date],
+    end: Optional[date],
+) -> Optional[Select]:
+    # SELECT of the archived rows (the _COLUMNS of transactions) in range, for
+    # the caller to UNION ALL with the hot table; None if the range isn't archived
+    rng = _cold_range(db, start, end)
+    if rng is None:
+        return None
+    start, cold_end = rng
+    A = models.ArchivedTransaction
+    q = select(*(getattr(A, c) for c in _COLUMNS)).where(A.user_id == user_id, A.tx_date <= cold_end)
+    if start is not None:
+        q = q.where(A.tx_date >= start)
+    if category_id is not None:
+        q = q.where(A.category_id == category_id)
+    return q
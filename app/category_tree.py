@@ -0,0 +1,75 @@
+# app/category_tree.py
+# Maintenance of the category_closure table.
+#
+# Every category has a (c, c, 0) row plus one row per ancestor, so subtree
+# rollups are a plain join on descendant_id instead of a recursive query.
+# Callers commit; these helpers only stage the closure changes.
+from typing import List, Optional
+
+from sqlalchemy import delete, insert, literal, select, true
+from sqlalchemy.orm import Session
+
+from app import models
+
+closure = models.CategoryClosure.__table__
+
+
+def add_node(db: Session, category_id: int, parent_id: Optional[int]) -> None:
+    db.execute(insert(closure).values(ancestor_id=category_id, descendant_id=category_id, depth=0))
+    if parent_id is not None:
+        db.execute(
+            insert(closure).from_select(
+                ["ancestor_id", "descendant_id", "depth"],
+                select(closure.c.ancestor_id, literal(category_id), closure.c.depth + 1)
+                .where(closure.c.descendant_id == parent_id),
+            )
+        )
+
+
+def move_node(db: Session, category_id: int, new_parent_id: Optional[int]) -> None:
+    subtree = select(closure.c.descendant_id).where(closure.c.ancestor_id == category_id)
+
+    # cut the subtree loose from its old ancestors...
+    db.execute(
+        delete(closure).where(
+            closure.c.descendant_id.in_(subtree),
+            closure.c.ancestor_id.not_in(subtree),
+        )
+    )
+    if new_parent_id is None:
+        return
+
+    # ...and hang it under every ancestor of the new parent
+    above = closure.alias("above")
+    below = closure.alias("below")
+    db.execute(
+        insert(closure).from_select(
+            ["ancestor_id", "descendant_id", "depth"],
+            select(above.c.ancestor_id, below.c.descendant_id, above.c.depth + below.c.depth + 1)
+            .select_from(above.join(below, true()))
+            .where(above.c.descendant_id == new_parent_id, below.c.ancestor_id == category_id),
+        )
+    )
+
+
+def remove_node(db: Session, category_id: int) -> None:
+    # leaf only; callers refuse to delete categories that still have children
+    db.execute(
+        delete(closure).where(
+            (closure.c.descendant_id == category_id) | (closure.c.ancestor_id == category_id)
+        )
+    )
+
+
+def is_descendant(db: Session, ancestor_id: int, category_id: int) -> bool:
+    return db.execute(
+        select(closure.c.depth).where(
+            closure.c.ancestor_id == ancestor_id, closure.c.descendant_id == category_id
+        )
+    ).first() is not None
+
+
+def subtree_ids(db: Session, category_id: int) -> List[int]:
+    return list(db.execute(
+        select(closure.c.descendant_id).where(closure.c.ancestor_id == category_id)
+    ).scalars())
@@ -2,7 +2,6 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-from jose import JWTError
 
 from app.database import get_db
 from app.core.security import decode_access_token
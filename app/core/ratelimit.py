@@ -0,0 +1,137 @@
+# app/core/ratelimit.py
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from app.core.security import decode_access_token
+
+DEFAULT_COST = 1
+
+# Cost in tokens per request, matched by longest path prefix.
+# Reports aggregate over the whole history, so they cost more than lists.
+ROUTE_COSTS: Dict[str, int] = {
+    "/reports": 5,
+    "/reports/cache-stats": DEFAULT_COST,
+    "/budgets/progress": 3,
+    # /batch itself costs DEFAULT_COST; each sub-request is charged as its own
+    # route from inside run_batch (see charge())
+}
+
+
+# In-memory token buckets, one per key. The OrderedDict is kept in last-seen
+# order, so a hit is O(1) and idle buckets are evicted from the front. A bucket
+# idle for a full refill period is back at capacity, so dropping it loses nothing.
+class TokenBucketStore:
+
+    def __init__(self, capacity: float, refill_per_sec: float, max_buckets: int = 100_000):
+        self.capacity = float(capacity)
+        self.refill_per_sec = float(refill_per_sec)
+        self.max_buckets = max_buckets
+        self.idle_ttl = self.capacity / self.refill_per_sec
+        # key -> [tokens, last_seen]
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, cost: float = 1, now: Optional[float] = None) -> Tuple[bool, float]:
+        # spend `cost` tokens -> (allowed, seconds until enough have refilled)
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = [self.capacity, now]
+                self._buckets[key] = bucket
+            else:
+                bucket[0] = min(self.capacity, bucket[0] + (now - bucket[1]) * self.refill_per_sec)
+                bucket[1] = now
+                self._buckets.move_to_end(key)
+            self._evict(now)
+
+            if bucket[0] >= cost:
+                bucket[0] -= cost
+                return True, 0.0
+            return False, (cost - bucket[0]) / self.refill_per_sec
+
+    def _evict(self, now: float) -> None:
+        buckets = self._buckets
+        while buckets:
+            _, (_, last_seen) = next(iter(buckets.items()))
+            if now - last_seen < self.idle_ttl and len(buckets) <= self.max_buckets:
+                break
+            buckets.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+def route_cost(path: str) -> int:
+    best, best_len = DEFAULT_COST, -1
+    for prefix, cost in ROUTE_COSTS.items():
+        if path.startswith(prefix) and len(prefix) > best_len:
+            best, best_len = cost, len(prefix)
+    return best
+
+
+def _client_key(scope) -> str:
+    # same token get_current_user sees; decode_access_token is cached so this is cheap
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and token:
+                payload = decode_access_token(token)
+                if payload and "sub" in payload:
+                    return f"user:{payload['sub']}"
+            break
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+def _take(store: TokenBucketStore, key: str, path: str) -> Tuple[bool, float]:
+    # a cost above capacity could never be paid (429 forever), so cap it
+    return store.take(key, min(route_cost(path), store.capacity))
+
+
+def charge(scope, path: str) -> Tuple[bool, float]:
+    # Charge `path`'s cost to the bucket the current request was charged to, for
+    # work done inside one request (the ops of a /batch). Always allowed when the
+    # middleware isn't installed.
+    limiter = scope.get("rate_limit")
+    if limiter is None:
+        return True, 0.0
+    store, key = limiter
+    return _take(store, key, path)
+
+
+# ASGI middleware: per-user token bucket, 429 + Retry-After when empty.
+# State is per process; with N workers each one enforces its own buckets.
+class RateLimitMiddleware:
+
+    def __init__(self, app, capacity: float = 60, refill_per_sec: float = 1.0, max_buckets: int = 100_000):
+        self.app = app
+        self.store = TokenBucketStore(capacity, refill_per_sec, max_buckets)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("method") == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        key = _client_key(scope)
+        allowed, retry_after = _take(self.store, key, scope["path"])
+        if allowed:
+            # lets handlers charge further work to the same bucket (charge())
+            scope["rate_limit"] = (self.store, key)
+            await self.app(scope, receive, send)
+            return
+
+        body = b'{"detail":"Too many requests"}'
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(math.ceil(retry_after)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
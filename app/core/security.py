@@ -1,22 +1,84 @@
 # app/core/security.py
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
-from jose import jwt
+from app.core.settings import settings
 
-# In real projects load from env vars
-SECRET_KEY = "change-this-now-please"
+# python-jose (and its crypto backends) and passlib/bcrypt are imported on
+# first use instead of at startup, to keep cold starts cheap.
+
+# Signing key comes from Settings (.env) so every worker agrees on it
+SECRET_KEY = settings.secret_key
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
+# Verified-claims cache: sha256(token) -> (exp timestamp, claims)
+TOKEN_CACHE_SIZE = 4096
+_token_cache: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _pwd_context():
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def warm_up() -> None:
+    # load jose and passlib/bcrypt once the worker is up, so the first login or
+    # authenticated request doesn't pay for the imports; `import main` still doesn't
+    from jose import jwt  # noqa: F401
+    _pwd_context()
+
+def hash_password(password: str) -> str:
+    return _pwd_context().hash(password)
+
+def verify_password(password: str, password_hash: str) -> bool:
+    return _pwd_context().verify(password, password_hash)
+
 def create_access_token(data: dict, expires_minutes: int = ACCESS_TOKEN_EXPIRE_MINUTES) -> str:
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + timedelta(minutes=expires_minutes)
     to_encode.update({"exp": expire})
+    from jose import jwt
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
-def decode_access_token(token: str) -> Optional[dict]:
+def _verify_token(token: str) -> Optional[dict]:
+    from jose import jwt
     try:
         return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except Exception:
         return None
+
+def clear_token_cache() -> None:
+    with _token_cache_lock:
+        _token_cache.clear()
+
+def decode_access_token(token: str) -> Optional[dict]:
+    key = hashlib.sha256(token.encode()).hexdigest()
+    now = time.time()
+
+    with _token_cache_lock:
+        hit = _token_cache.get(key)
+        if hit is not None:
+            exp, claims = hit
+            if exp > now:
+                _token_cache.move_to_end(key)
+                return dict(claims)
+            # expired: drop it and let jwt.decode report the failure
+            del _token_cache[key]
+
+    claims = _verify_token(token)
+    # only cache tokens that carry an expiry, so entries can't outlive the token
+    if claims is None or not isinstance(claims.get("exp"), (int, float)):
+        return claims
+
+    with _token_cache_lock:
+        _token_cache[key] = (float(claims["exp"]), dict(claims))
+        _token_cache.move_to_end(key)
+        while len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+    return claims
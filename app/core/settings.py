@@ -14,6 +14,14 @@ class Settings(BaseSettings):
     secret_key: str = "dev-secret-change-me"
     database_url: str = "sqlite:///./expense.db"
     allowed_origins: str = "http://localhost:3000,http://127.0.0.1:3000"
+    # serve.py creates the schema once before forking and turns this off for workers
+    create_schema_on_startup: bool = True
+    # per-user token bucket: burst size and tokens regained per second
+    rate_limit_enabled: bool = True
+    rate_limit_capacity: int = 60
+    rate_limit_refill_per_sec: float = 1.0
+    # in-process per-user ledger cache for reports; 0 disables it
+    ledger_cache_mb: int = 0
 
     # Also tell pydantic-settings where the .env is
     model_config = SettingsConfigDict(
@@ -0,0 +1,51 @@
+# app/db/init_db.py
+from sqlalchemy import inspect, text
+
+from app.db.session import Base, engine
+from app import models  # also registers every table on Base.metadata
+
+def init_db(bind=engine) -> None:
+    # create any missing tables, then bring older databases up to date;
+    # safe to call repeatedly
+    Base.metadata.create_all(bind=bind)
+    _migrate(bind)
+
+def _migrate(bind) -> None:
+    columns = {c["name"] for c in inspect(bind).get_columns("categories")}
+    with bind.begin() as conn:
+        if "parent_id" not in columns:
+            conn.execute(text("ALTER TABLE categories ADD COLUMN parent_id INTEGER REFERENCES categories(id)"))
+        # every category needs its (c, c, 0) closure row; pre-hierarchy ones are all roots
+        conn.execute(text(
+            "INSERT INTO category_closure (ancestor_id, descendant_id, depth) "
+            "SELECT id, id, 0 FROM categories "
+            "WHERE id NOT IN (SELECT descendant_id FROM category_closure WHERE depth = 0)"
+        ))
+        if bind.dialect.name == "sqlite":
+            _autoincrement_transactions(conn)
+
+def _autoincrement_transactions(conn) -> None:
+    # Plain INTEGER PRIMARY KEY reuses max(rowid)+1, so archiving the newest row
+    # would let its id be handed out again. SQLite can only add AUTOINCREMENT by
+    # rebuilding the table.
+    ddl = conn.execute(text(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'transactions'"
+    )).scalar()
+    if "AUTOINCREMENT" in ddl.upper():
+        return
+
+    cols = ", ".join(c.name for c in models.Transaction.__table__.columns)
+    conn.execute(text("ALTER TABLE transactions RENAME TO transactions_old"))
+    for index in models.Transaction.__table__.indexes:
+        conn.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+    models.Transaction.__table__.create(conn)
+    conn.execute(text(f"INSERT INTO transactions ({cols}) SELECT {cols} FROM transactions_old"))
+    conn.execute(text("DROP TABLE transactions_old"))
+
+    # start the sequence above every id already used, archived ones included
+    high = conn.execute(text(
+        "SELECT MAX(m) FROM (SELECT MAX(id) AS m FROM transactions "
+        "UNION ALL SELECT MAX(id) FROM transactions_archive)"
+    )).scalar() or 0
+    conn.execute(text("DELETE FROM sqlite_sequence WHERE name = 'transactions'"))
+    conn.execute(text("INSERT INTO sqlite_sequence (name, seq) VALUES ('transactions', :seq)"), {"seq": high})
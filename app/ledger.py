@@ -0,0 +1,307 @@
+# app/ledger.py
+# Optional in-process ledger snapshot per user, for hot dashboards.
+#
+# A snapshot holds, per category, the user's transaction dates (as ordinals)
+# in sorted array('i') form next to a running array('q') of amounts in cents,
+# so the total for any date range is two bisects and a subtraction. Hot and
+# archived transactions are both loaded, so archiving never invalidates it.
+#
+# Snapshots are tagged with the user's ledger_versions row. Every transaction
+# or category write bumps that row (bump()), and every read compares against
+# it, so a worker never serves a snapshot another worker has made stale. The
+# worker that made a transaction write patches its own cached snapshot with
+# the delta (apply_change()) instead of rebuilding it on the next read.
+# Cached snapshots are evicted LRU-first to stay under settings.ledger_cache_mb;
+# a user whose snapshot alone would exceed that is served from SQL instead.
+import copy
+import math
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, defaultdict
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.settings import settings
+
+# rough per-category cost of the Python objects around the two arrays
+_CATEGORY_OVERHEAD = 256
+# users whose snapshot didn't fit the budget, remembered per version
+_OVERSIZE_MEMORY = 4096
+
+
+def _cents(amount) -> int:
+    # amount * 100 rounded half away from zero, in double arithmetic like the
+    # SQL reports' SUM(amount)
+    value = float(amount) * 100
+    return int(math.copysign(math.floor(abs(value) + 0.5), value))
+
+
+class LedgerSnapshot:
+    def __init__(
+        self,
+        version: int,
+        categories: Dict[int, Tuple[str, str, Optional[int]]],
+        ancestors: Dict[int, List[int]],
+        rows,
+    ):
+        self.version = version
+        self.categories = categories  # id -> (name, type, parent_id)
+        self.ancestors = ancestors    # id -> ancestor ids, including itself
+
+        per_cat: Dict[int, list] = defaultdict(list)
+        for day, category_id, cents in rows:
+            # like the SQL joins: transactions whose category is gone don't count
+            if category_id in categories:
+                per_cat[category_id].append((day, cents))
+
+        self.columns: Dict[int, Tuple[array, array]] = {}
+        for category_id, items in per_cat.items():
+            items.sort()
+            days = array("i", (day for day, _ in items))
+            prefix = array("q", [0])
+            running = 0
+            for _, cents in items:
+                running += cents
+                prefix.append(running)
+            self.columns[category_id] = (days, prefix)
+
+        self.nbytes = self._measure()
+
+    def _measure(self) -> int:
+        return sum(
+            len(days) * days.itemsize + len(prefix) * prefix.itemsize + _CATEGORY_OVERHEAD
+            for days, prefix in self.columns.values()
+        ) + _CATEGORY_OVERHEAD * len(self.categories)
+
+    def with_change(self, version: int, old=None, new=None) -> Optional["LedgerSnapshot"]:
+        # Copy-on-write delta: readers may still hold self, so only the dict and
+        # the touched category's arrays are copied. old/new are
+        # (tx_date, category_id, amount) of the row before/after the write.
+        # Returns None if the change can't be applied (e.g. a category newer
+        # than the snapshot); the caller then drops it.
+        snap = copy.copy(self)
+        snap.columns = dict(self.columns)
+        snap.version = version
+        copied = set()
+
+        def column(category_id):
+            if category_id not in copied:
+                days, prefix = snap.columns.get(category_id) or (array("i"), array("q", [0]))
+                snap.columns[category_id] = (array("i", days), array("q", prefix))
+                copied.add(category_id)
+            return snap.columns[category_id]
+
+        if old is not None:
+            tx_date, category_id, amount = old
+            if category_id not in snap.columns:
+                return None
+            days, prefix = column(category_id)
+            day, cents = tx_date.toordinal(), _cents(amount)
+            for i in range(bisect_left(days, day), bisect_right(days, day)):
+                if prefix[i + 1] - prefix[i] == cents:
+                    break
+            else:
+                return None
+            del days[i]
+            del prefix[i + 1]
+            for j in range(i + 1, len(prefix)):
+                prefix[j] -= cents
+
+        if new is not None:
+            tx_date, category_id, amount = new
+            if category_id not in snap.categories:
+                return None
+            days, prefix = column(category_id)
+            day, cents = tx_date.toordinal(), _cents(amount)
+            i = bisect_right(days, day)
+            days.insert(i, day)
+            prefix.insert(i + 1, prefix[i])
+            for j in range(i + 1, len(prefix)):
+                prefix[j] += cents
+
+        snap.nbytes = snap._measure()
+        return snap
+
+    def category_totals(self, start: Optional[date], end: Optional[date], rollup: bool = False) -> Dict[int, int]:
+        # cents per category for transactions in [start, end]; with rollup, per ancestor
+        lo_day = start.toordinal() if start is not None else None
+        hi_day = end.toordinal() if end is not None else None
+        totals: Dict[int, int] = {}
+        for category_id, (days, prefix) in self.columns.items():
+            lo = bisect_left(days, lo_day) if lo_day is not None else 0
+            hi = bisect_right(days, hi_day) if hi_day is not None else len(days)
+            if hi <= lo:
+                continue
+            cents = prefix[hi] - prefix[lo]
+            for target in (self.ancestors.get(category_id, [category_id]) if rollup else (category_id,)):
+                totals[target] = totals.get(target, 0) + cents
+        return totals
+
+    def spent(
+        self, start: date, end: date, category_type: str, ancestor_id: Optional[int] = None
+    ) -> int:
+        # cents of one type in [start, end], optionally limited to a category subtree
+        return sum(
+            cents
+            for category_id, cents in self.category_totals(start, end).items()
+            if self.categories[category_id][1] == category_type
+            and (ancestor_id is None or ancestor_id in self.ancestors.get(category_id, ()))
+        )
+
+
+_cache: "OrderedDict[int, LedgerSnapshot]" = OrderedDict()
+_cache_bytes = 0
+_cache_lock = threading.Lock()
+_oversize: "OrderedDict[int, int]" = OrderedDict()  # user_id -> version
+_stats = {"hits": 0, "misses": 0, "deltas": 0, "evictions": 0, "oversize": 0}
+
+
+def enabled() -> bool:
+    return settings.ledger_cache_mb > 0
+
+
+def _budget() -> int:
+    return settings.ledger_cache_mb * 1024 * 1024
+
+
+def bump(db: Session, user_id: int) -> Optional[int]:
+    # call from every write that changes a user's transactions or categories,
+    # inside the same DB transaction; returns the new version, or None when the
+    # cache is off (no snapshot anywhere to keep consistent)
+    if not enabled():
+        return None
+    V = models.LedgerVersion
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    stmt = (
+        dialect.insert(V)
+        .values(user_id=user_id, version=1)
+        .on_conflict_do_update(index_elements=[V.user_id], set_={"version": V.version + 1})
+        .returning(V.version)
+    )
+    return db.execute(stmt).scalar_one()
+
+
+def apply_change(user_id: int, version: Optional[int], old=None, new=None) -> None:
+    # after commit: patch this worker's cached snapshot with one transaction
+    # write (see LedgerSnapshot.with_change) and move it to `version`
+    global _cache_bytes
+    if version is None:
+        return
+    with _cache_lock:
+        snap = _cache.get(user_id)
+        if snap is None:
+            return
+        # only if no other write landed in between; otherwise the version check rebuilds
+        patched = snap.with_change(version, old, new) if snap.version == version - 1 else None
+        _cache_bytes -= snap.nbytes
+        if patched is None:
+            del _cache[user_id]
+            return
+        _cache[user_id] = patched
+        _cache_bytes += patched.nbytes
+        _stats["deltas"] += 1
+        _evict_over_budget()
+
+
+def _evict_over_budget() -> None:
+    # caller holds _cache_lock
+    global _cache_bytes
+    while _cache_bytes > _budget() and _cache:
+        _, evicted = _cache.popitem(last=False)
+        _cache_bytes -= evicted.nbytes
+        _stats["evictions"] += 1
+
+
+def _build(db: Session, user_id: int, version: int) -> LedgerSnapshot:
+    C = models.Category
+    categories = {
+        r.id: (r.name, r.type, r.parent_id)
+        for r in db.execute(select(C.id, C.name, C.type, C.parent_id).where(C.user_id == user_id))
+    }
+    ancestors: Dict[int, List[int]] = defaultdict(list)
+    CC = models.CategoryClosure
+    for anc, desc in db.execute(
+        select(CC.ancestor_id, CC.descendant_id)
+        .join(C, C.id == CC.descendant_id)
+        .where(C.user_id == user_id)
+    ):
+        ancestors[desc].append(anc)
+
+    rows = []
+    for T in (models.Transaction, models.ArchivedTransaction):
+        # converted here rather than in SQL so the build works on any backend
+        rows.extend(
+            (tx_date.toordinal(), category_id, _cents(amount))
+            for tx_date, category_id, amount in db.execute(
+                select(T.tx_date, T.category_id, T.amount).where(T.user_id == user_id)
+            )
+        )
+    return LedgerSnapshot(version, categories, dict(ancestors), rows)
+
+
+def get_snapshot(db: Session, user_id: int) -> Optional[LedgerSnapshot]:
+    # None when the cache is disabled or this user's snapshot won't fit the
+    # budget; callers fall back to SQL
+    global _cache_bytes
+    if not enabled():
+        return None
+
+    version = db.execute(
+        select(models.LedgerVersion.version).where(models.LedgerVersion.user_id == user_id)
+    ).scalar() or 0
+
+    with _cache_lock:
+        snap = _cache.get(user_id)
+        if snap is not None and snap.version == version:
+            _cache.move_to_end(user_id)
+            _stats["hits"] += 1
+            return snap
+        if _oversize.get(user_id) == version:
+            _stats["oversize"] += 1
+            return None
+        _stats["misses"] += 1
+
+    snap = _build(db, user_id, version)
+
+    with _cache_lock:
+        old = _cache.pop(user_id, None)
+        if old is not None:
+            _cache_bytes -= old.nbytes
+        if snap.nbytes > _budget():
+            # caching it is impossible and rebuilding per request costs more than SQL
+            _oversize[user_id] = version
+            _oversize.move_to_end(user_id)
+            while len(_oversize) > _OVERSIZE_MEMORY:
+                _oversize.popitem(last=False)
+            _stats["oversize"] += 1
+            return None
+        _oversize.pop(user_id, None)
+        _cache[user_id] = snap
+        _cache_bytes += snap.nbytes
+        _evict_over_budget()
+    return snap
+
+
+def clear() -> None:
+    global _cache_bytes
+    with _cache_lock:
+        _cache.clear()
+        _oversize.clear()
+        _cache_bytes = 0
+
+
+def cache_stats() -> Dict[str, Any]:
+    with _cache_lock:
+        return {
+            "enabled": enabled(),
+            "users": len(_cache),
+            "bytes": _cache_bytes,
+            "budget_bytes": _budget(),
+            **_stats,
+        }
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Numeric, Date, func
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Numeric, Date, Index, func
 from sqlalchemy.orm import relationship
 from app.db.session import Base
 # app/models.py (append at bottom)
@@ -35,11 +35,28 @@ class Category(Base):
     name = Column(String, nullable=False)
     type = Column(String, nullable=False)  # 'expense' or 'income'
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # NULL for top-level categories; ancestry is mirrored in category_closure
+    parent_id = Column(Integer, ForeignKey("categories.id"), nullable=True)
 
     user = relationship("User", backref="categories")
 
+class CategoryClosure(Base):
+    # one row per (ancestor, descendant) pair, including (c, c) at depth 0,
+    # so "everything under X" is a single join (see app/category_tree.py)
+    __tablename__ = "category_closure"
+    __table_args__ = (
+        Index("ix_category_closure_descendant", "descendant_id"),
+    )
+
+    ancestor_id = Column(Integer, ForeignKey("categories.id"), primary_key=True)
+    descendant_id = Column(Integer, ForeignKey("categories.id"), primary_key=True)
+    depth = Column(Integer, nullable=False)
+
 class Transaction(Base):
     __tablename__ = "transactions"
+    # AUTOINCREMENT: ids of rows moved to transactions_archive must never be
+    # handed out again (see app/db/init_db.py for the migration)
+    __table_args__ = {"sqlite_autoincrement": True}
 
     id = Column(Integer, primary_key=True, index=True)
     amount = Column(Numeric(10,2), nullable=False)
@@ -52,3 +69,45 @@ class Transaction(Base):
 
     user = relationship("User", backref="transactions")
     category = relationship("Category", backref="transactions")
+
+# ---- Cold storage (see app/archive.py) ----
+
+class ArchivedTransaction(Base):
+    __tablename__ = "transactions_archive"
+    __table_args__ = (
+        Index("ix_transactions_archive_user_date", "user_id", "tx_date"),
+    )
+
+    archive_id = Column(Integer, primary_key=True)
+    id = Column(Integer, nullable=False, index=True)  # original transactions.id
+    amount = Column(Numeric(10,2), nullable=False)
+    currency = Column(String, default="USD")
+    note = Column(String)
+    tx_date = Column(Date, nullable=False)
+
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
+
+class MonthlyTotal(Base):
+    # pre-aggregated archived spend: one row per (user, "YYYY-MM", category)
+    __tablename__ = "monthly_totals"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    month = Column(String, primary_key=True)
+    category_id = Column(Integer, ForeignKey("categories.id"), primary_key=True)
+    total = Column(Numeric(12, 2), nullable=False)
+
+class ArchiveState(Base):
+    # single row (id=1): every transaction dated before `cutoff` lives in the archive
+    __tablename__ = "archive_state"
+
+    id = Column(Integer, primary_key=True)
+    cutoff = Column(Date, nullable=False)
+
+class LedgerVersion(Base):
+    # bumped by every transaction/category write; in-process ledger caches
+    # (app/ledger.py) compare against it, so all workers see the same data
+    __tablename__ = "ledger_versions"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
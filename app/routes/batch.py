@@ -0,0 +1,104 @@
+# app/routes/batch.py
+import math
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.core.deps import get_current_user
+from app.core.ratelimit import charge
+from app import models, schemas
+from app.routes import reports, budgets, transactions
+
+router = APIRouter(prefix="/batch", tags=["batch"])
+
+_PARAMS = {
+    "reports.summary": schemas.SummaryParams,
+    "budgets.progress": schemas.BudgetProgressParams,
+    "budgets.list": schemas.BudgetListParams,
+    "transactions.list": schemas.TransactionListParams,
+}
+
+# the route each op stands in for, so it's rate-limited like the real request
+_PATHS = {
+    "reports.summary": "/reports/summary",
+    "budgets.progress": "/budgets/progress",
+    "budgets.list": "/budgets/",
+    "transactions.list": "/transactions/",
+}
+
+def _budget_progress(db, user, p: schemas.BudgetProgressParams):
+    return budgets.budget_progress(month=p.month, category_id=p.category_id, db=db, current_user=user)
+
+def _budget_list(db, user, p: schemas.BudgetListParams):
+    rows = budgets.list_budgets(db=db, current_user=user, month=p.month)
+    return [schemas.BudgetOut.model_validate(b) for b in rows]
+
+def _transaction_list(db, user, p: schemas.TransactionListParams):
+    rows = transactions.list_transactions(
+        db=db, current_user=user, category_id=p.category_id,
+        start_date=p.start_date, end_date=p.end_date, limit=p.limit, offset=p.offset,
+    )
+    return [schemas.TransactionOut.model_validate(t) for t in rows]
+
+_HANDLERS: Dict[str, Callable] = {
+    "budgets.progress": _budget_progress,
+    "budgets.list": _budget_list,
+    "transactions.list": _transaction_list,
+}
+
+def _result(item: schemas.BatchItem, status: int, body: Any = None, detail: Any = None) -> Dict[str, Any]:
+    out = {"id": item.id, "op": item.op, "status": status}
+    if detail is not None:
+        out["detail"] = detail
+    else:
+        out["body"] = body
+    return out
+
+@router.post("")
+def run_batch(
+    request: Request,
+    payload: schemas.BatchRequest,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+) -> Dict[str, List[Dict[str, Any]]]:
+    # one auth check and one DB session for every sub-request; results come back
+    # in request order, each with its own status so one failure doesn't sink the rest
+    results: List[Optional[Dict[str, Any]]] = [None] * len(payload.requests)
+    parsed = []
+    for i, item in enumerate(payload.requests):
+        try:
+            params = _PARAMS[item.op].model_validate(item.params)
+        except ValidationError as e:
+            results[i] = _result(item, 422, detail=e.errors(include_url=False, include_context=False))
+            continue
+        # each valid op is charged like the request it replaces; ops the bucket
+        # can't pay for get their own 429 instead of failing the whole batch
+        allowed, retry_after = charge(request.scope, _PATHS[item.op])
+        if not allowed:
+            results[i] = _result(item, 429, detail="Too many requests")
+            results[i]["retry_after"] = math.ceil(retry_after)
+            continue
+        parsed.append((i, item, params))
+
+    # summaries with the same rollup flag are merged into one query
+    summary_groups: Dict[bool, List[Tuple[int, schemas.BatchItem, schemas.SummaryParams]]] = {}
+    for i, item, p in parsed:
+        if item.op == "reports.summary":
+            summary_groups.setdefault(p.rollup, []).append((i, item, p))
+    for rollup, group in summary_groups.items():
+        ranges = [(p.start_date, p.end_date) for _, _, p in group]
+        for (i, item, _), body in zip(group, reports.summaries(db, current_user.id, ranges, rollup)):
+            results[i] = _result(item, 200, body)
+
+    for i, item, p in parsed:
+        if item.op == "reports.summary":
+            continue
+        try:
+            results[i] = _result(item, 200, _HANDLERS[item.op](db, current_user, p))
+        except HTTPException as e:
+            results[i] = _result(item, e.status_code, detail=e.detail)
+
+    return {"results": results}
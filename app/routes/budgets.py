@@ -6,7 +6,7 @@ from sqlalchemy import func
 
 from app.database import get_db
 from app.core.deps import get_current_user
-from app import models, schemas
+from app import models, schemas, archive, ledger
 
 router = APIRouter(prefix="/budgets", tags=["budgets"])
 
@@ -118,6 +118,38 @@ def delete_budget(
     db.delete(b)
     db.commit()
 
+def _sql_spent(db: Session, user_id: int, month: str, category_id: Optional[int]) -> float:
+    # figure month boundaries
+    # naive boundaries using string prefix match on "YYYY-MM"
+    # Sum only EXPENSE transactions for this user in that month (+ optional category)
+    q = (
+        db.query(func.coalesce(func.sum(models.Transaction.amount), 0))
+        .select_from(models.Transaction)
+        .join(models.Category, models.Category.id == models.Transaction.category_id)
+        .filter(
+            models.Transaction.user_id == user_id,
+            models.Category.type == "expense",
+            func.strftime("%Y-%m", models.Transaction.tx_date) == month,
+        )
+    )
+    if category_id is not None:
+        # a budget on a parent category covers spend in all of its subcategories
+        q = (
+            q.join(models.CategoryClosure, models.CategoryClosure.descendant_id == models.Transaction.category_id)
+             .filter(models.CategoryClosure.ancestor_id == category_id)
+        )
+
+    spent = float(q.scalar())
+
+    # archived months: add pre-aggregated cold spend
+    bounds = archive.month_bounds(month)
+    if bounds is not None:
+        spent += archive.cold_total(
+            db, user_id, bounds[0], bounds[1], "expense",
+            ancestor_id=category_id,
+        )
+    return spent
+
 @router.get("/progress")
 def budget_progress(
     month: str = Query(..., description='"YYYY-MM"'),
@@ -137,23 +169,14 @@ def budget_progress(
     if not budget:
         raise HTTPException(status_code=404, detail="No budget set for this scope")
 
-    # figure month boundaries
-    # naive boundaries using string prefix match on "YYYY-MM"
-    # Sum only EXPENSE transactions for this user in that month (+ optional category)
-    q = (
-        db.query(func.coalesce(func.sum(models.Transaction.amount), 0))
-        .select_from(models.Transaction)
-        .join(models.Category, models.Category.id == models.Transaction.category_id)
-        .filter(
-            models.Transaction.user_id == current_user.id,
-            models.Category.type == "expense",
-            func.strftime("%Y-%m", models.Transaction.tx_date) == month,
-        )
-    )
-    if category_id is not None:
-        q = q.filter(models.Transaction.category_id == category_id)
+    snap = ledger.get_snapshot(db, current_user.id)
+    if snap is not None:
+        # served from the in-process ledger
+        bounds = archive.month_bounds(month)
+        spent = snap.spent(*bounds, "expense", category_id) / 100 if bounds else 0.0
+    else:
+        spent = _sql_spent(db, current_user.id, month, category_id)
 
-    spent = float(q.scalar())
     limit_amount = float(budget.limit_amount)
     remaining = float(max(limit_amount - spent, 0.0))
     used_pct = float(0 if limit_amount == 0 else (spent / limit_amount) * 100.0)
@@ -2,11 +2,31 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List
 from app.database import get_db
-from app import models, schemas
+from app import models, schemas, category_tree, ledger
 from app.core.deps import get_current_user
 
 router = APIRouter(prefix="/categories", tags=["categories"])
 
+def _check_parent(db: Session, user_id: int, parent_id: int, ctype: str) -> models.Category:
+    parent = (
+        db.query(models.Category)
+        .filter(models.Category.id == parent_id, models.Category.user_id == user_id)
+        .first()
+    )
+    if not parent:
+        raise HTTPException(status_code=404, detail="Parent category not found for this user")
+    # rollups sum a whole subtree, so it must not mix income and expense
+    if parent.type != ctype:
+        raise HTTPException(status_code=400, detail="Parent category must have the same type")
+    return parent
+
+def _has_children(db: Session, category_id: int) -> bool:
+    return (
+        db.query(models.Category.id)
+        .filter(models.Category.parent_id == category_id)
+        .first()
+    ) is not None
+
 @router.post("/", response_model=schemas.CategoryOut, status_code=201)
 def create_category(
     payload: schemas.CategoryCreate,
@@ -26,12 +46,18 @@ def create_category(
     if existing:
         raise HTTPException(status_code=400, detail="Category already exists")
 
+    if payload.parent_id is not None:
+        _check_parent(db, current_user.id, payload.parent_id, payload.type)
+
     cat = models.Category(
         name=payload.name,
         type=payload.type,
         user_id=current_user.id,
+        parent_id=payload.parent_id,
     )
     db.add(cat)
+    db.flush()
+    category_tree.add_node(db, cat.id, cat.parent_id)
     db.commit()
     db.refresh(cat)
     return cat
@@ -91,9 +117,24 @@ def update_category(
         if exists:
             raise HTTPException(status_code=400, detail="Category already exists")
 
+    ctype = data.get("type", cat.type)
+    if ctype != cat.type and _has_children(db, cat.id):
+        raise HTTPException(status_code=400, detail="Category has subcategories")
+
+    moved = "parent_id" in data and data["parent_id"] != cat.parent_id
+    parent_id = data.get("parent_id", cat.parent_id)
+    if parent_id is not None and (moved or ctype != cat.type):
+        _check_parent(db, current_user.id, parent_id, ctype)
+        # no cycles: the new parent can't sit inside this category's subtree
+        if category_tree.is_descendant(db, cat.id, parent_id):
+            raise HTTPException(status_code=400, detail="Category cannot be moved under itself")
+
     for k, v in data.items():
         setattr(cat, k, v)
+    if moved:
+        category_tree.move_node(db, cat.id, cat.parent_id)
 
+    ledger.bump(db, current_user.id)
     db.commit()
     db.refresh(cat)
     return cat
@@ -115,6 +156,10 @@ def delete_category(
     )
     if not cat:
         raise HTTPException(status_code=404, detail="Category not found")
+    if _has_children(db, cat.id):
+        raise HTTPException(status_code=400, detail="Category has subcategories")
 
+    category_tree.remove_node(db, cat.id)
     db.delete(cat)
+    ledger.bump(db, current_user.id)
     db.commit()
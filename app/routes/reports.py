@@ -1,13 +1,13 @@
 from datetime import date
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func
+from sqlalchemy import and_, case, func, true
 from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.core.deps import get_current_user
-from app import models
+from app import models, archive, ledger
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
@@ -18,70 +18,116 @@ def _apply_date_range(q, start_date: Optional[date], end_date: Optional[date]):
         q = q.filter(models.Transaction.tx_date <= end_date)
     return q
 
+Range = Tuple[Optional[date], Optional[date]]
+
+def _sql_category_totals(db: Session, user_id: int, ranges: List[Range], rollup: bool) -> List[Dict[int, float]]:
+    # Per-category totals from the hot table, one dict per date range. All
+    # ranges share a single scan: each gets its own SUM(CASE WHEN in range ...)
+    # column. With rollup, each transaction counts towards every ancestor of
+    # its category via the closure table.
+    T = models.Transaction
+    Closure = models.CategoryClosure
+    cat_col = Closure.ancestor_id if rollup else T.category_id
+
+    def in_range(start: Optional[date], end: Optional[date]):
+        conds = []
+        if start is not None:
+            conds.append(T.tx_date >= start)
+        if end is not None:
+            conds.append(T.tx_date <= end)
+        return and_(*conds) if conds else true()
+
+    sums = [
+        func.sum(case((in_range(start, end), T.amount))).label(f"r{i}")
+        for i, (start, end) in enumerate(ranges)
+    ]
+    hot_rows = db.query(cat_col.label("category_id"), *sums).filter(T.user_id == user_id)
+    if rollup:
+        hot_rows = hot_rows.join(Closure, Closure.descendant_id == T.category_id)
+    # only scan the span the ranges cover
+    starts = [start for start, _ in ranges]
+    ends = [end for _, end in ranges]
+    hot_rows = _apply_date_range(
+        hot_rows.group_by(cat_col),
+        None if None in starts else min(starts),
+        None if None in ends else max(ends),
+    ).all()
+
+    results = []
+    for i, (start, end) in enumerate(ranges):
+        # ...plus archived spend when the range reaches before the archive cutoff
+        totals = archive.cold_totals_by_category(db, user_id, start, end)
+        if rollup and totals:
+            rolled: Dict[int, float] = {}
+            for anc, desc in db.query(Closure.ancestor_id, Closure.descendant_id).filter(
+                Closure.descendant_id.in_(totals)
+            ):
+                rolled[anc] = rolled.get(anc, 0.0) + totals[desc]
+            totals = rolled
+        for r in hot_rows:
+            if r[i + 1] is not None:
+                totals[r.category_id] = totals.get(r.category_id, 0.0) + float(r[i + 1])
+        results.append(totals)
+    return results
+
+def summaries(db: Session, user_id: int, ranges: List[Range], rollup: bool = False) -> List[Dict[str, Any]]:
+    # one summary per (start_date, end_date) range, sharing the underlying queries
+    snap = ledger.get_snapshot(db, user_id)
+    if snap is not None:
+        # served from the in-process ledger: no SQL beyond its version check
+        all_totals = [
+            {cid: cents / 100 for cid, cents in snap.category_totals(start, end, rollup).items()}
+            for start, end in ranges
+        ]
+        info = snap.categories
+    else:
+        all_totals = _sql_category_totals(db, user_id, ranges, rollup)
+        ids = set().union(*all_totals)
+        info = {
+            c.id: (c.name, c.type, c.parent_id)
+            for c in db.query(models.Category).filter(models.Category.id.in_(ids))
+        } if ids else {}
+
+    out = []
+    for (start_date, end_date), totals in zip(ranges, all_totals):
+        by_category: List[Dict[str, Any]] = [
+            {
+                "category_id": cid,
+                "name": info[cid][0],
+                "type": info[cid][1],
+                "parent_id": info[cid][2],
+                "total": float(totals[cid]),
+            }
+            for cid in sorted(totals)
+            if cid in info
+        ]
+
+        # Totals by type (rolled-up totals already include children, so only count roots)
+        counted = [r for r in by_category if not rollup or r["parent_id"] is None]
+        total_income = sum(r["total"] for r in counted if r["type"] == "income")
+        total_expense = sum(r["total"] for r in counted if r["type"] == "expense")
+
+        out.append({
+            "start_date": start_date,
+            "end_date": end_date,
+            "income": float(total_income),
+            "expense": float(total_expense),
+            "net": float(total_income - total_expense),
+            "by_category": by_category,
+        })
+    return out
+
 @router.get("/summary")
 def summary_report(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
     start_date: Optional[date] = Query(None, description="Inclusive yyyy-mm-dd"),
     end_date: Optional[date] = Query(None, description="Inclusive yyyy-mm-dd"),
+    rollup: bool = Query(False, description="Category totals include their subcategories"),
 ) -> Dict[str, Any]:
-    # Base filter: current user
-    base = db.query(models.Transaction).filter(models.Transaction.user_id == current_user.id)
-    base = _apply_date_range(base, start_date, end_date)
-
-    # Totals by type
-    total_income = (
-        db.query(func.coalesce(func.sum(models.Transaction.amount), 0))
-        .select_from(models.Transaction)
-        .join(models.Category, models.Category.id == models.Transaction.category_id)
-        .filter(
-            models.Transaction.user_id == current_user.id,
-            models.Category.type == "income",
-        )
-    )
-    total_income = _apply_date_range(total_income, start_date, end_date).scalar()
-
-    total_expense = (
-        db.query(func.coalesce(func.sum(models.Transaction.amount), 0))
-        .select_from(models.Transaction)
-        .join(models.Category, models.Category.id == models.Transaction.category_id)
-        .filter(
-            models.Transaction.user_id == current_user.id,
-            models.Category.type == "expense",
-        )
-    )
-    total_expense = _apply_date_range(total_expense, start_date, end_date).scalar()
-
-    # Per-category totals
-    per_cat_rows = (
-        db.query(
-            models.Category.id.label("category_id"),
-            models.Category.name.label("name"),
-            models.Category.type.label("type"),
-            func.coalesce(func.sum(models.Transaction.amount), 0).label("total"),
-        )
-        .select_from(models.Transaction)
-        .join(models.Category, models.Category.id == models.Transaction.category_id)
-        .filter(models.Transaction.user_id == current_user.id)
-        .group_by(models.Category.id, models.Category.name, models.Category.type)
-    )
-    per_cat_rows = _apply_date_range(per_cat_rows, start_date, end_date).all()
-
-    by_category: List[Dict[str, Any]] = [
-        {
-            "category_id": r.category_id,
-            "name": r.name,
-            "type": r.type,
-            "total": float(r.total),
-        }
-        for r in per_cat_rows
-    ]
+    return summaries(db, current_user.id, [(start_date, end_date)], rollup)[0]
 
-    return {
-        "start_date": start_date,
-        "end_date": end_date,
-        "income": float(total_income),
-        "expense": float(total_expense),
-        "net": float(total_income - total_expense),
-        "by_category": by_category,
-    }
+@router.get("/cache-stats")
+def cache_stats(current_user: models.User = Depends(get_current_user)) -> Dict[str, Any]:
+    # per-worker numbers for the in-process ledger cache
+    return ledger.cache_stats()
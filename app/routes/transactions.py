@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select, union_all
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date
 from app.database import get_db
-from app import models, schemas
+from app import models, schemas, archive, ledger
 from app.core.deps import get_current_user
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 @router.post("/", response_model=schemas.TransactionOut, status_code=201)
@@ -34,8 +35,10 @@ def create_transaction(
         category_id=payload.category_id,
     )
     db.add(tx)
+    version = ledger.bump(db, current_user.id)
     db.commit()
     db.refresh(tx)
+    ledger.apply_change(current_user.id, version, new=(tx.tx_date, tx.category_id, payload.amount))
     return tx
 from fastapi import Path
 
@@ -72,11 +75,17 @@ def update_transaction(
         if not cat:
             raise HTTPException(status_code=404, detail="Category not found for this user")
 
+    old = (tx.tx_date, tx.category_id, tx.amount)
     for k, v in data.items():
         setattr(tx, k, v)
 
+    version = ledger.bump(db, current_user.id)
     db.commit()
     db.refresh(tx)
+    ledger.apply_change(
+        current_user.id, version, old=old,
+        new=(tx.tx_date, tx.category_id, data.get("amount", old[2])),
+    )
     return tx
 
 
@@ -97,8 +106,11 @@ def delete_transaction(
     if not tx:
         raise HTTPException(status_code=404, detail="Transaction not found")
 
+    old = (tx.tx_date, tx.category_id, tx.amount)
     db.delete(tx)
+    version = ledger.bump(db, current_user.id)
     db.commit()
+    ledger.apply_change(current_user.id, version, old=old)
 
 
 @router.get("/", response_model=List[schemas.TransactionOut])
@@ -120,9 +132,18 @@ def list_transactions(
     if end_date is not None:
         q = q.filter(models.Transaction.tx_date <= end_date)
 
-    return (
-        q.order_by(models.Transaction.tx_date.desc(), models.Transaction.id.desc())
-         .offset(offset)
-         .limit(limit)
-         .all()
-    )
\ No newline at end of file
+    # ranges reaching before the archive cutoff also read cold storage
+    cold = archive.cold_transactions(db, current_user.id, category_id, start_date, end_date)
+    if cold is None:
+        q = q.order_by(models.Transaction.tx_date.desc(), models.Transaction.id.desc())
+        return q.offset(offset).limit(limit).all()
+
+    # merged and paged in SQL, so a deep offset never loads rows into Python
+    hot = q.with_entities(*(getattr(models.Transaction, c.name) for c in cold.selected_columns)).statement
+    both = union_all(hot, cold).subquery()
+    return db.execute(
+        select(both)
+        .order_by(both.c.tx_date.desc(), both.c.id.desc())
+        .offset(offset)
+        .limit(limit)
+    ).all()
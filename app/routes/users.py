@@ -1,15 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
 from typing import List
 
 from app.database import get_db
 from app import models, schemas
+from app.core.security import hash_password
 
 router = APIRouter(prefix="/users", tags=["users"])
 
-pwd_ctx = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 @router.post("/", response_model=schemas.UserOut, status_code=201)
 def create_user(payload: schemas.UserCreate, db: Session = Depends(get_db)):
     # unique email check
@@ -17,7 +15,7 @@ def create_user(payload: schemas.UserCreate, db: Session = Depends(get_db)):
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
 
-    password_hash = pwd_ctx.hash(payload.password)
+    password_hash = hash_password(payload.password)
     user = models.User(email=payload.email, password_hash=password_hash)
     db.add(user)
     db.commit()
@@ -1,5 +1,5 @@
 from datetime import date
-from typing import Optional, Literal
+from typing import Any, Dict, List, Optional, Literal
 from pydantic import BaseModel, ConfigDict, Field, EmailStr
 
 
@@ -42,6 +42,7 @@ class TransactionUpdate(BaseModel):
 class CategoryCreate(BaseModel):
     name: str
     type: Literal["expense", "income"]  # only these two, enforced by Pydantic
+    parent_id: Optional[int] = None  # null => top-level; must be same user and type
 
 class CategoryOut(CategoryCreate):
     id: int
@@ -51,6 +52,7 @@ class CategoryOut(CategoryCreate):
 class CategoryUpdate(BaseModel):
     name: Optional[str] = None
     type: Optional[Literal["expense", "income"]] = None
+    parent_id: Optional[int] = None
 
 
 class UserCreate(BaseModel):
@@ -70,3 +72,33 @@ class LoginRequest(BaseModel):
 class TokenOut(BaseModel):
     access_token: str
     token_type: str = "bearer"
+
+# ---- Batch ----
+# params for each sub-request mirror the query parameters of the GET endpoint
+
+class SummaryParams(BaseModel):
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    rollup: bool = False
+
+class BudgetProgressParams(BaseModel):
+    month: str                 # "YYYY-MM"
+    category_id: Optional[int] = None
+
+class BudgetListParams(BaseModel):
+    month: Optional[str] = None
+
+class TransactionListParams(BaseModel):
+    category_id: Optional[int] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    limit: int = Field(20, ge=1, le=100)
+    offset: int = Field(0, ge=0)
+
+class BatchItem(BaseModel):
+    id: Optional[str] = None   # echoed back so clients can match results
+    op: Literal["reports.summary", "budgets.progress", "budgets.list", "transactions.list"]
+    params: Dict[str, Any] = {}
+
+class BatchRequest(BaseModel):
+    requests: List[BatchItem] = Field(min_length=1, max_length=20)
@@ -0,0 +1,29 @@
+# archive.py
+# Move old transactions into cold storage (see app/archive.py).
+#   python archive.py --before 2024-01-01
+#   python archive.py --older-than-days 365
+import argparse
+from datetime import date, timedelta
+
+from app.db.init_db import init_db
+from app.db.session import SessionLocal
+from app.archive import archive_before
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive transactions older than a cutoff")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--before", type=date.fromisoformat, help="yyyy-mm-dd; rounded down to the 1st of the month")
+    group.add_argument("--older-than-days", type=int)
+    args = parser.parse_args()
+
+    before = args.before or date.today() - timedelta(days=args.older_than_days)
+    init_db()
+    db = SessionLocal()
+    try:
+        moved = archive_before(db, before)
+    finally:
+        db.close()
+    print(f"archived {moved} transactions dated before {before.replace(day=1)}")
+
+if __name__ == "__main__":
+    main()
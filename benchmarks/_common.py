@@ -0,0 +1,74 @@
+# benchmarks/_common.py
+# Scaffolding shared by the benchmark scripts: a throwaway SQLite database,
+# a seeded user, and a timer.
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from app import category_tree, models
+from app.db.init_db import init_db
+
+
+def temp_db() -> Session:
+    # session on a fresh file-backed database with the app's schema
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_engine(f"sqlite:///{path}")
+    init_db(engine)
+    return sessionmaker(bind=engine)()
+
+
+def seed(
+    db: Session,
+    categories: int,
+    transactions: int,
+    start: date,
+    days: int,
+    parent: Callable[[int, List[int]], Optional[int]] = lambda i, ids: None,
+    income_categories: int = 0,
+    password_hash: str = "x",
+) -> Tuple[models.User, List[int]]:
+    # one user with `categories` categories (the first `income_categories` are
+    # income; parent(i, ids) picks category i's parent id) and `transactions`
+    # random ones spread over `days` days from `start`
+    user = models.User(email="bench@example.com", password_hash=password_hash)
+    db.add(user)
+    db.commit()
+
+    ids: List[int] = []
+    for i in range(categories):
+        parent_id = parent(i, ids)
+        cat = models.Category(
+            name=f"cat{i}", type="income" if i < income_categories else "expense",
+            user_id=user.id, parent_id=parent_id,
+        )
+        db.add(cat)
+        db.flush()
+        category_tree.add_node(db, cat.id, parent_id)
+        ids.append(cat.id)
+
+    db.execute(insert(models.Transaction.__table__), [
+        {
+            "amount": round(random.uniform(1, 200), 2),
+            "currency": "USD",
+            "tx_date": start + timedelta(days=random.randrange(days)),
+            "user_id": user.id,
+            "category_id": random.choice(ids),
+        }
+        for _ in range(transactions)
+    ])
+    db.commit()
+    return user, ids
+
+
+def time_ms(fn: Callable[[], object], runs: int) -> float:
+    # mean wall time of fn() over `runs` calls, in milliseconds
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - start) / runs * 1000
@@ -0,0 +1,42 @@
+# benchmarks/bench_archive.py
+# Latency of recent-data queries (last 30 days) before and after archiving
+# everything older than a year.
+#   python -m benchmarks.bench_archive
+from datetime import date, timedelta
+
+from app import archive
+from app.routes.reports import summary_report
+from app.routes.transactions import list_transactions
+from benchmarks._common import seed, temp_db, time_ms
+
+YEARS = 5
+TX_PER_DAY = 100
+RUNS = 50
+
+def main():
+    db = temp_db()
+    days = 365 * YEARS
+    user, _ = seed(db, categories=10, transactions=days * TX_PER_DAY,
+                   start=date.today() - timedelta(days=days - 1), days=days, income_categories=1)
+
+    start = date.today() - timedelta(days=30)
+    queries = {
+        "summary (30d)": lambda: summary_report(db=db, current_user=user, start_date=start, end_date=None, rollup=False),
+        "list page 1 (30d)": lambda: list_transactions(
+            db=db, current_user=user, category_id=None, start_date=start, end_date=None, limit=20, offset=0
+        ),
+        "summary (all)": lambda: summary_report(db=db, current_user=user, start_date=None, end_date=None, rollup=False),
+    }
+
+    before = {name: time_ms(fn, RUNS) for name, fn in queries.items()}
+    moved = archive.archive_before(db, date.today() - timedelta(days=365))
+    after = {name: time_ms(fn, RUNS) for name, fn in queries.items()}
+
+    print(f"archived {moved} of {365 * YEARS * TX_PER_DAY} transactions")
+    print(f"{'query':<20} {'before ms':>10} {'after ms':>10}")
+    for name in queries:
+        print(f"{name:<20} {before[name]:>10.2f} {after[name]:>10.2f}")
+    db.close()
+
+if __name__ == "__main__":
+    main()
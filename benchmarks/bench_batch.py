@@ -0,0 +1,100 @@
+# benchmarks/bench_batch.py
+# End-to-end latency of a mobile-style dashboard against a live server:
+# sequential GETs vs. one POST /batch carrying the same sub-requests.
+#   python -m benchmarks.bench_batch
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from datetime import date
+
+PORT = 8766
+BASE = f"http://127.0.0.1:{PORT}"
+TRANSACTIONS = 20_000
+RUNS = 30
+
+def _seed(database_url: str):
+    # runs in this process against the same file the server will use
+    os.environ["DATABASE_URL"] = database_url
+    from app.db.init_db import init_db
+    from app.db.session import SessionLocal
+    from app import models
+    from app.core.security import hash_password
+    from benchmarks._common import seed
+
+    init_db()
+    db = SessionLocal()
+    user, ids = seed(db, categories=10, transactions=TRANSACTIONS, start=date(2025, 1, 1), days=365,
+                     password_hash=hash_password("pw"))
+    for cid in ids[:4]:
+        db.add(models.Budget(user_id=user.id, month="2025-06", category_id=cid, limit_amount=1000))
+    db.commit()
+    db.close()
+    return ids[:4]
+
+def _call(method: str, path: str, token: str = None, body=None):
+    req = urllib.request.Request(BASE + path, method=method)
+    if token:
+        req.add_header("Authorization", f"Bearer {token}")
+    data = None
+    if body is not None:
+        data = json.dumps(body).encode()
+        req.add_header("Content-Type", "application/json")
+    with urllib.request.urlopen(req, data=data, timeout=30) as resp:
+        return json.loads(resp.read() or b"null")
+
+def _wait_ready():
+    for _ in range(300):
+        try:
+            return _call("GET", "/")
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError("server did not come up")
+
+def main():
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    database_url = f"sqlite:///{path}"
+    budget_cats = _seed(database_url)
+
+    env = dict(os.environ, DATABASE_URL=database_url, RATE_LIMIT_ENABLED="false")
+    proc = subprocess.Popen(
+        [sys.executable, "serve.py", "--workers", "1", "--port", str(PORT), "--host", "127.0.0.1"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        _wait_ready()
+        token = _call("POST", "/auth/login", body={"email": "bench@example.com", "password": "pw"})["access_token"]
+
+        ranges = [("2025-06-01", "2025-06-30"), ("2025-04-01", "2025-06-30"), ("2025-01-01", "2025-12-31")]
+        gets = [f"/reports/summary?start_date={s}&end_date={e}" for s, e in ranges]
+        gets += [f"/budgets/progress?month=2025-06&category_id={cid}" for cid in budget_cats]
+        gets.append("/transactions/?limit=20")
+
+        batch = {"requests": (
+            [{"op": "reports.summary", "params": {"start_date": s, "end_date": e}} for s, e in ranges]
+            + [{"op": "budgets.progress", "params": {"month": "2025-06", "category_id": cid}} for cid in budget_cats]
+            + [{"op": "transactions.list", "params": {"limit": 20}}]
+        )}
+
+        def sequential():
+            for path in gets:
+                _call("GET", path, token)
+
+        def batched():
+            _call("POST", "/batch", token, batch)
+
+        for name, fn in (("sequential", sequential), ("batch", batched)):
+            fn()  # warm
+            start = time.perf_counter()
+            for _ in range(RUNS):
+                fn()
+            print(f"{name:<12} {len(gets)} sub-requests  {(time.perf_counter() - start) / RUNS * 1000:8.2f} ms")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+if __name__ == "__main__":
+    main()
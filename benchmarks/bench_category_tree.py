@@ -0,0 +1,68 @@
+# benchmarks/bench_category_tree.py
+# Subtree rollups over a deep category tree: closure-table join (what the
+# routes use) vs. the equivalent recursive CTE.
+#   python -m benchmarks.bench_category_tree
+from datetime import date
+
+from sqlalchemy import text
+
+from app import models
+from app.routes.reports import summary_report
+from app.routes.budgets import budget_progress
+from benchmarks._common import seed, temp_db, time_ms
+
+CATEGORIES = 3000
+FANOUT = 2          # binary tree -> depth ~11
+TRANSACTIONS = 100_000
+RUNS = 20
+
+RECURSIVE_ROLLUP = text("""
+    WITH RECURSIVE tree(ancestor_id, descendant_id) AS (
+        SELECT id, id FROM categories WHERE user_id = :uid
+        UNION ALL
+        SELECT tree.ancestor_id, c.id FROM tree JOIN categories c ON c.parent_id = tree.descendant_id
+    )
+    SELECT tree.ancestor_id, SUM(t.amount)
+    FROM transactions t JOIN tree ON tree.descendant_id = t.category_id
+    WHERE t.user_id = :uid
+    GROUP BY tree.ancestor_id
+""")
+
+RECURSIVE_SUBTREE = text("""
+    WITH RECURSIVE tree(id) AS (
+        SELECT :root UNION ALL SELECT c.id FROM categories c JOIN tree ON c.parent_id = tree.id
+    )
+    SELECT COALESCE(SUM(t.amount), 0)
+    FROM transactions t JOIN categories c ON c.id = t.category_id
+    WHERE t.user_id = :uid AND c.type = 'expense' AND t.category_id IN (SELECT id FROM tree)
+      AND strftime('%Y-%m', t.tx_date) = :month
+""")
+
+def main():
+    db = temp_db()
+    user, ids = seed(db, categories=CATEGORIES, transactions=TRANSACTIONS, start=date(2025, 1, 1), days=365,
+                     parent=lambda i, ids: ids[(i - 1) // FANOUT] if i else None)
+    root = ids[0]
+    db.add(models.Budget(user_id=user.id, month="2025-06", category_id=root, limit_amount=1000))
+    db.commit()
+    depth = db.execute(text("SELECT MAX(depth) FROM category_closure")).scalar()
+
+    cases = {
+        "summary flat": lambda: summary_report(
+            db=db, current_user=user, start_date=None, end_date=None, rollup=False),
+        "summary rollup (closure)": lambda: summary_report(
+            db=db, current_user=user, start_date=None, end_date=None, rollup=True),
+        "rollup (recursive CTE)": lambda: db.execute(RECURSIVE_ROLLUP, {"uid": user.id}).all(),
+        "root budget (closure)": lambda: budget_progress(
+            month="2025-06", category_id=root, db=db, current_user=user),
+        "root budget (recursive CTE)": lambda: db.execute(
+            RECURSIVE_SUBTREE, {"uid": user.id, "root": root, "month": "2025-06"}).scalar(),
+    }
+
+    print(f"{CATEGORIES} categories, depth {depth}, {TRANSACTIONS} transactions")
+    for name, fn in cases.items():
+        print(f"{name:<28} {time_ms(fn, RUNS):8.2f} ms")
+    db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# benchmarks/bench_ledger.py
+# Dashboard reports (summary + budget progress) via SQL vs. the in-process
+# ledger snapshot.
+#   python -m benchmarks.bench_ledger
+import time
+from datetime import date
+
+from app import models, ledger
+from app.core.settings import settings
+from app.routes.reports import summary_report
+from app.routes.budgets import budget_progress
+from benchmarks._common import seed, temp_db, time_ms
+
+TRANSACTIONS = 50_000
+CATEGORIES = 40
+RUNS = 50
+
+def main():
+    db = temp_db()
+    user, ids = seed(db, categories=CATEGORIES, transactions=TRANSACTIONS, start=date(2021, 1, 1), days=5 * 365,
+                     parent=lambda i, ids: ids[i // 4] if i >= 4 else None)
+    root = ids[0]
+    db.add(models.Budget(user_id=user.id, month="2025-06", category_id=root, limit_amount=1000))
+    db.commit()
+
+    def dashboard():
+        summary_report(db=db, current_user=user, start_date=date(2025, 6, 1), end_date=date(2025, 6, 30), rollup=False)
+        summary_report(db=db, current_user=user, start_date=None, end_date=None, rollup=True)
+        budget_progress(month="2025-06", category_id=root, db=db, current_user=user)
+
+    settings.ledger_cache_mb = 0
+    sql_ms = time_ms(dashboard, RUNS)
+
+    settings.ledger_cache_mb = 64
+    start = time.perf_counter()
+    ledger.get_snapshot(db, user.id)
+    build_ms = (time.perf_counter() - start) * 1000
+    cached_ms = time_ms(dashboard, RUNS)
+
+    print(f"{TRANSACTIONS} transactions, {CATEGORIES} categories")
+    print(f"dashboard via SQL       {sql_ms:8.2f} ms")
+    print(f"dashboard via ledger    {cached_ms:8.2f} ms")
+    print(f"snapshot build (miss)   {build_ms:8.2f} ms")
+    print(ledger.cache_stats())
+    db.close()
+
+if __name__ == "__main__":
+    main()
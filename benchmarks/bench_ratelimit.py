@@ -0,0 +1,49 @@
+# benchmarks/bench_ratelimit.py
+# Per-request overhead of RateLimitMiddleware around a no-op ASGI app.
+#   python -m benchmarks.bench_ratelimit
+import asyncio
+import time
+
+from app.core.ratelimit import RateLimitMiddleware
+from app.core.security import create_access_token
+
+N = 50_000
+
+async def _noop_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+async def _receive():
+    return {"type": "http.request", "body": b""}
+
+async def _send(message):
+    pass
+
+async def _run(app, scopes) -> float:
+    start = time.perf_counter()
+    for scope in scopes:
+        await app(scope, _receive, _send)
+    return time.perf_counter() - start
+
+def main():
+    # 1000 distinct users hitting /transactions/ round-robin, bucket never empties
+    tokens = [create_access_token({"sub": str(i)}) for i in range(1000)]
+    scopes = [
+        {
+            "type": "http", "method": "GET", "path": "/transactions/",
+            "headers": [(b"authorization", f"Bearer {tokens[i % len(tokens)]}".encode())],
+            "client": ("127.0.0.1", 1234),
+        }
+        for i in range(N)
+    ]
+    limited = RateLimitMiddleware(_noop_app, capacity=10**9, refill_per_sec=1.0)
+
+    asyncio.run(_run(limited, scopes[:len(tokens)]))  # warm the token cache
+    base = asyncio.run(_run(_noop_app, scopes))
+    with_rl = asyncio.run(_run(limited, scopes))
+    print(f"no middleware  {base / N * 1e6:7.2f} us/request")
+    print(f"rate limited   {with_rl / N * 1e6:7.2f} us/request")
+    print(f"overhead       {(with_rl - base) / N * 1e6:7.2f} us/request")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# benchmarks/bench_serve.py
+# Time-to-first-request and throughput of serve.py for 1..N workers.
+#   python -m benchmarks.bench_serve --max-workers 4
+import argparse
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+PORT = 8765
+URL = f"http://127.0.0.1:{PORT}/"
+
+def _get():
+    with urllib.request.urlopen(URL, timeout=5) as resp:
+        resp.read()
+
+def _wait_ready(timeout=30.0) -> float:
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        try:
+            _get()
+            return time.perf_counter() - start
+        except OSError:
+            time.sleep(0.01)
+    raise RuntimeError("server did not come up")
+
+def _throughput(seconds: float, concurrency: int) -> float:
+    deadline = time.perf_counter() + seconds
+
+    def worker():
+        n = 0
+        while time.perf_counter() < deadline:
+            _get()
+            n += 1
+        return n
+
+    with ThreadPoolExecutor(concurrency) as pool:
+        total = sum(pool.map(lambda _: worker(), range(concurrency)))
+    return total / seconds
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    print(f"{'workers':>7} {'first req (s)':>14} {'req/s':>10}")
+    for n in range(1, args.max_workers + 1):
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, "serve.py", "--workers", str(n), "--port", str(PORT), "--host", "127.0.0.1"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            _wait_ready()
+            ttfr = time.perf_counter() - start
+            rps = _throughput(args.seconds, args.concurrency)
+            print(f"{n:>7} {ttfr:>14.2f} {rps:>10.0f}")
+        finally:
+            proc.terminate()
+            proc.wait()
+
+if __name__ == "__main__":
+    main()
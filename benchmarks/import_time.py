@@ -0,0 +1,56 @@
+# benchmarks/import_time.py
+# Profile the cost of `import main` with `python -X importtime`.
+#   python -m benchmarks.import_time            # top 20 modules by cumulative time
+#   python -m benchmarks.import_time --check    # exit 1 if over budget
+import argparse
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+from app._startup import IMPORT_BUDGET_MS, LAZY_MODULES
+
+def profile(module: str = "main") -> List[Tuple[str, int, int]]:
+    """Return (module, self_us, cumulative_us) rows for `import <module>`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cum_us)))
+    return rows
+
+def check(rows: List[Tuple[str, int, int]], budget_ms: float = IMPORT_BUDGET_MS) -> List[str]:
+    """Return a list of problems; empty means startup imports are within budget."""
+    problems = []
+    top: Dict[str, int] = {name: cum for name, _, cum in rows}
+    total_ms = top.get("main", 0) / 1000
+    if total_ms > budget_ms:
+        problems.append(f"import main took {total_ms:.0f} ms (budget {budget_ms:.0f} ms)")
+    for name, _, _ in rows:
+        if name.split(".")[0] in LAZY_MODULES:
+            problems.append(f"{name} imported at startup")
+    return problems
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--check", action="store_true", help="exit 1 if over budget")
+    args = parser.parse_args()
+
+    rows = profile()
+    for name, self_us, cum_us in sorted(rows, key=lambda r: r[2], reverse=True)[: args.top]:
+        print(f"{cum_us / 1000:9.1f} ms {self_us / 1000:9.1f} ms  {name}")
+
+    problems = check(rows, args.budget_ms)
+    for p in problems:
+        print("FAIL:", p)
+    if args.check and problems:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
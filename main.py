@@ -1,27 +1,53 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from app.db.session import Base, engine
+from sqlalchemy import text
+from app.db.session import engine
+from app.db.init_db import init_db
 from app.routes.transactions import router as transactions_router
 from app.routes.categories import router as categories_router
 from app.routes.users import router as users_router
 from app.routes.auth import router as auth_router
 from app.routes.reports import router as reports_router
 from app.routes.budgets import router as budgets_router
+from app.routes.batch import router as batch_router
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.settings import settings
-import app.models
-app=FastAPI()
+from app.core.security import clear_token_cache, warm_up
+from app.core.ratelimit import RateLimitMiddleware
+from app import ledger
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.create_schema_on_startup:
+        init_db()
+    # open a pooled connection now so the first request doesn't pay for it
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    warm_up()
+    yield
+    # drain: uvicorn has finished in-flight requests by the time we get here
+    clear_token_cache()
+    ledger.clear()
+    engine.dispose()
+
+app=FastAPI(lifespan=lifespan)
 @app.get("/")
 def home():
     return{"message": "Expense tracker is runnning"}
-@app.on_event("startup")
-def on_startup():
-    Base.metadata.create_all(bind=engine)
 app.include_router(transactions_router)
 app.include_router(categories_router)
 app.include_router(users_router)
 app.include_router(auth_router)
 app.include_router(reports_router)
 app.include_router(budgets_router)
+app.include_router(batch_router)
+if settings.rate_limit_enabled:
+    # added before CORS so 429 responses still carry CORS headers
+    app.add_middleware(
+        RateLimitMiddleware,
+        capacity=settings.rate_limit_capacity,
+        refill_per_sec=settings.rate_limit_refill_per_sec,
+    )
 origins = settings.allowed_origins.split(",")
 app.add_middleware(
     CORSMiddleware,
@@ -29,4 +55,4 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-)
\ No newline at end of file
+)
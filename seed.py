@@ -1,9 +1,10 @@
 # seed.py
-from app.db.session import SessionLocal, engine, Base
-from app import models
+from app.db.session import SessionLocal
+from app.db.init_db import init_db
+from app import models, category_tree
 
 # make sure tables exist
-Base.metadata.create_all(bind=engine)
+init_db()
 
 db = SessionLocal()
 
@@ -16,6 +17,8 @@ db.refresh(user)
 # create a test category
 cat = models.Category(name="Food", type="expense", user_id=user.id)
 db.add(cat)
+db.flush()
+category_tree.add_node(db, cat.id, cat.parent_id)
 db.commit()
 db.refresh(cat)
 
@@ -0,0 +1,38 @@
+# serve.py
+# Production launcher: create/upgrade the schema once, then fork N uvicorn workers.
+#   python serve.py --workers 4 --port 8000
+import argparse
+import os
+
+import uvicorn
+
+from app.core.settings import settings
+from app.db.init_db import init_db
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the expense tracker API")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--graceful-timeout", type=int, default=30,
+                        help="seconds to wait for in-flight requests on shutdown")
+    args = parser.parse_args()
+
+    # schema work happens once here, not racing in every worker
+    init_db()
+    # the env var reaches spawned workers; with --workers 1 uvicorn serves from
+    # this process, where settings was already built
+    os.environ["CREATE_SCHEMA_ON_STARTUP"] = "false"
+    settings.create_schema_on_startup = False
+
+    uvicorn.run(
+        "main:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        proxy_headers=True,
+    )
+
+if __name__ == "__main__":
+    main()
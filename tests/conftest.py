@@ -0,0 +1,65 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import models, schemas
+from app.db.init_db import init_db
+from app.routes.categories import create_category
+from app.routes.transactions import create_transaction
+
+
+@pytest.fixture
+def engine():
+    # fresh in-memory database per test, with the same schema/migrations as the app
+    eng = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    init_db(eng)
+    yield eng
+    eng.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def user(db):
+    u = models.User(email="test@example.com", password_hash="x")
+    db.add(u)
+    db.commit()
+    db.refresh(u)
+    return u
+
+
+@pytest.fixture
+def make_category(db, user):
+    def make(name, type="expense", parent_id=None):
+        return create_category(
+            payload=schemas.CategoryCreate(name=name, type=type, parent_id=parent_id),
+            db=db, current_user=user,
+        )
+    return make
+
+
+@pytest.fixture
+def add_transaction(db, user):
+    def add(category_id, tx_date, amount=10):
+        return create_transaction(
+            payload=schemas.TransactionCreate(amount=amount, tx_date=tx_date, category_id=category_id),
+            db=db, current_user=user,
+        )
+    return add
+
+
+def rounded(value):
+    # report floats to cents, so SQL and Python sums compare equal
+    if isinstance(value, float):
+        return round(value, 2)
+    if isinstance(value, dict):
+        return {k: rounded(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [rounded(v) for v in value]
+    return value
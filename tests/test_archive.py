@@ -0,0 +1,132 @@
+import random
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from app import archive, models, schemas
+from app.db.init_db import init_db
+from app.routes.budgets import budget_progress
+from app.routes.reports import summary_report
+from tests.conftest import rounded
+from app.routes.transactions import list_transactions
+
+RANGES = [
+    (None, None),
+    (date(2021, 3, 15), date(2022, 7, 3)),    # ragged both ends, crosses cutoff month
+    (date(2022, 2, 1), date(2022, 2, 28)),    # exactly one archived month
+    (date(2022, 2, 10), None),                # ragged start, open end
+    (None, date(2021, 12, 31)),
+    (date(2022, 12, 20), date(2023, 1, 10)),  # straddles the cutoff
+    (date(2023, 5, 5), date(2023, 5, 20)),    # hot only
+]
+
+
+def _snapshot(db, user, cats):
+    out = []
+    for start, end in RANGES:
+        for rollup in (False, True):
+            out.append(summary_report(db=db, current_user=user, start_date=start, end_date=end, rollup=rollup))
+        rows = list_transactions(db=db, current_user=user, category_id=None,
+                                 start_date=start, end_date=end, limit=50, offset=30)
+        out.append([(t.id, t.tx_date) for t in rows])
+    out.append(budget_progress(month="2022-03", category_id=cats[1].id, db=db, current_user=user)["spent"])
+    return out
+
+
+def test_archived_results_match_unarchived(db, user, make_category, add_transaction):
+    cats = [make_category("salary", "income")]
+    cats.append(make_category("food"))
+    cats.append(make_category("groceries", parent_id=cats[1].id))
+    rng = random.Random(1)
+    for _ in range(600):
+        add_transaction(rng.choice(cats).id, date(2021, 1, 1) + timedelta(days=rng.randrange(1000)),
+             amount=round(rng.uniform(1, 100), 2))
+    db.add(models.Budget(user_id=user.id, month="2022-03", category_id=cats[1].id, limit_amount=100))
+    db.commit()
+
+    before = rounded(_snapshot(db, user, cats))
+    assert archive.archive_before(db, date(2023, 1, 17)) > 0
+    assert archive.archive_cutoff(db) == date(2023, 1, 1)
+    assert rounded(_snapshot(db, user, cats)) == before
+
+    # archiving again with a later cutoff keeps monthly totals consistent
+    archive.archive_before(db, date(2023, 3, 2))
+    assert rounded(_snapshot(db, user, cats)) == before
+
+
+def test_backdated_insert_after_archival_is_counted(db, user, make_category, add_transaction):
+    food = make_category("food")
+    add_transaction(food.id, date(2020, 5, 1), amount=5)
+    archive.archive_before(db, date(2024, 1, 1))
+    add_transaction(food.id, date(2020, 5, 2), amount=7)
+
+    report = summary_report(db=db, current_user=user, start_date=date(2020, 5, 1),
+                            end_date=date(2020, 5, 31), rollup=False)
+    assert report["expense"] == 12
+
+
+def test_listing_pages_through_hot_and_cold(db, user, make_category, add_transaction):
+    food = make_category("food")
+    for i in range(40):
+        add_transaction(food.id, date(2022, 11, 1) + timedelta(days=i * 3 // 2), amount=i + 0.25)
+
+    def pages():
+        out = []
+        for offset in range(0, 45, 7):
+            rows = list_transactions(db=db, current_user=user, category_id=None,
+                                     start_date=None, end_date=None, limit=7, offset=offset)
+            out.extend(schemas.TransactionOut.model_validate(t).model_dump() for t in rows)
+        return out
+
+    before = pages()
+    assert len(before) == 40
+    archive.archive_before(db, date(2022, 12, 10))
+    assert pages() == before
+    assert list_transactions(db=db, current_user=user, category_id=None,
+                             start_date=None, end_date=None, limit=100, offset=500_000) == []
+
+
+def test_archived_ids_are_not_reused(db, user, make_category, add_transaction):
+    food = make_category("food")
+    add_transaction(food.id, date(2025, 6, 1))
+    backdated_id = add_transaction(food.id, date(2020, 6, 1)).id
+    archive.archive_before(db, date(2024, 1, 1))
+
+    new = add_transaction(food.id, date(2025, 7, 1))
+    assert new.id > backdated_id
+    ids = [t.id for t in list_transactions(db=db, current_user=user, category_id=None,
+                                           start_date=None, end_date=None, limit=100, offset=0)]
+    assert len(ids) == len(set(ids)) == 3
+
+
+def test_migration_adds_autoincrement_above_archived_ids():
+    eng = create_engine("sqlite://", poolclass=StaticPool)
+    with eng.begin() as conn:
+        # pre-AUTOINCREMENT layout, with id 5 already living in the archive
+        conn.execute(text(
+            "CREATE TABLE transactions (id INTEGER NOT NULL PRIMARY KEY, amount NUMERIC(10, 2) NOT NULL, "
+            "currency VARCHAR, note VARCHAR, tx_date DATE NOT NULL, user_id INTEGER NOT NULL, "
+            "category_id INTEGER NOT NULL)"
+        ))
+        conn.execute(text("CREATE INDEX ix_transactions_id ON transactions (id)"))
+        conn.execute(text("INSERT INTO transactions VALUES (3, 1, 'USD', NULL, '2025-01-01', 1, 1)"))
+    models.ArchivedTransaction.__table__.create(eng)
+    with eng.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO transactions_archive (id, amount, currency, tx_date, user_id, category_id) "
+            "VALUES (5, 1, 'USD', '2020-01-01', 1, 1)"
+        ))
+
+    init_db(eng)
+    init_db(eng)  # idempotent
+
+    with eng.begin() as conn:
+        ddl = conn.execute(text("SELECT sql FROM sqlite_master WHERE name = 'transactions'")).scalar()
+        assert "AUTOINCREMENT" in ddl
+        assert conn.execute(text("SELECT id FROM transactions")).scalars().all() == [3]
+        conn.execute(text(
+            "INSERT INTO transactions (amount, tx_date, user_id, category_id) VALUES (1, '2025-02-01', 1, 1)"
+        ))
+        assert conn.execute(text("SELECT MAX(id) FROM transactions")).scalar() == 6
+    eng.dispose()
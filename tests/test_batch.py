@@ -0,0 +1,123 @@
+from datetime import date
+
+import pytest
+from starlette.requests import Request
+
+from app import schemas
+from app.core.ratelimit import TokenBucketStore
+from app.routes.batch import run_batch
+from app.routes.budgets import budget_progress, create_budget, list_budgets
+from app.routes.reports import summary_report
+from app.routes.transactions import list_transactions
+
+
+def _request(limiter=None):
+    scope = {"type": "http", "method": "POST", "path": "/batch", "headers": []}
+    if limiter is not None:
+        scope["rate_limit"] = limiter
+    return Request(scope)
+
+
+def _batch(db, user, items, limiter=None):
+    payload = schemas.BatchRequest(requests=[schemas.BatchItem(**item) for item in items])
+    return run_batch(request=_request(limiter), payload=payload, db=db, current_user=user)["results"]
+
+
+def _json(body):
+    # pydantic models as they'd be serialized in the response
+    if isinstance(body, list):
+        return [_json(b) for b in body]
+    return body.model_dump() if hasattr(body, "model_dump") else body
+
+
+@pytest.fixture
+def batch_data(db, user, make_category, add_transaction):
+    food = make_category("food")
+    groceries = make_category("groceries", parent_id=food.id)
+    salary = make_category("salary", type="income")
+    for day, cat, amount in [
+        (date(2025, 5, 30), food.id, 12.5), (date(2025, 6, 1), groceries.id, 40),
+        (date(2025, 6, 15), food.id, 7.25), (date(2025, 6, 30), salary.id, 3000),
+        (date(2025, 7, 2), groceries.id, 19.99),
+    ]:
+        add_transaction(cat, day, amount)
+    create_budget(payload=schemas.BudgetCreate(month="2025-06", limit_amount=100), db=db, current_user=user)
+    return food
+
+
+def test_batch_matches_individual_calls(db, user, batch_data):
+    food = batch_data
+    ranges = [(None, None), (date(2025, 6, 1), date(2025, 6, 30)), (date(2025, 6, 15), None)]
+    items = [
+        {"id": f"s{i}", "op": "reports.summary",
+         "params": {"start_date": s and s.isoformat(), "end_date": e and e.isoformat(), "rollup": rollup}}
+        for i, (s, e) in enumerate(ranges) for rollup in (False, True)
+    ] + [
+        {"id": "progress", "op": "budgets.progress", "params": {"month": "2025-06"}},
+        {"id": "budgets", "op": "budgets.list", "params": {}},
+        {"id": "txs", "op": "transactions.list", "params": {"category_id": food.id, "limit": 5}},
+    ]
+    results = _batch(db, user, items)
+
+    assert [r["id"] for r in results] == [item["id"] for item in items]
+    assert all(r["status"] == 200 for r in results)
+    # merged multi-range summaries give the same answers as one call per range
+    expected = [
+        summary_report(db=db, current_user=user, start_date=s, end_date=e, rollup=rollup)
+        for s, e in ranges for rollup in (False, True)
+    ]
+    assert [r["body"] for r in results[:6]] == expected
+    assert results[6]["body"] == budget_progress(month="2025-06", category_id=None, db=db, current_user=user)
+    assert _json(results[7]["body"]) == _json(
+        [schemas.BudgetOut.model_validate(b) for b in list_budgets(db=db, current_user=user, month=None)]
+    )
+    assert _json(results[8]["body"]) == _json([
+        schemas.TransactionOut.model_validate(t) for t in list_transactions(
+            db=db, current_user=user, category_id=food.id, start_date=None, end_date=None, limit=5, offset=0,
+        )
+    ])
+
+
+def test_failed_items_get_their_own_status(db, user, batch_data):
+    results = _batch(db, user, [
+        {"id": "missing", "op": "budgets.progress", "params": {"month": "2024-01"}},
+        {"id": "bad-date", "op": "reports.summary", "params": {"start_date": "not-a-date"}},
+        {"id": "bad-limit", "op": "transactions.list", "params": {"limit": 0}},
+        {"id": "no-month", "op": "budgets.progress", "params": {}},
+        {"id": "ok", "op": "budgets.list", "params": {"month": "2025-06"}},
+    ])
+    status = {r["id"]: r["status"] for r in results}
+    assert status == {"missing": 404, "bad-date": 422, "bad-limit": 422, "no-month": 422, "ok": 200}
+    assert results[0]["detail"] == "No budget set for this scope"
+    assert results[1]["detail"][0]["loc"] == ("start_date",)
+    assert "body" not in results[0] and "detail" not in results[4]
+    assert len(results[4]["body"]) == 1
+
+
+def test_ops_are_charged_like_their_routes(db, user, batch_data):
+    store = TokenBucketStore(capacity=10, refill_per_sec=0.5)
+    results = _batch(db, user, [
+        {"id": "a", "op": "reports.summary", "params": {}},      # 5
+        {"id": "b", "op": "budgets.progress", "params": {"month": "2025-06"}},  # 3
+        {"id": "c", "op": "reports.summary", "params": {}},      # 5: only 2 left
+        {"id": "d", "op": "transactions.list", "params": {}},    # 1
+    ], limiter=(store, "user:1"))
+
+    assert [r["status"] for r in results] == [200, 200, 429, 200]
+    # three tokens short at 0.5 tokens/s
+    assert results[2]["retry_after"] == 6
+    assert store.take("user:1", 1)[0] and not store.take("user:1", 1)[0]
+
+
+def test_invalid_ops_are_not_charged(db, user, batch_data):
+    store = TokenBucketStore(capacity=5, refill_per_sec=0.01)
+    results = _batch(db, user, [
+        {"id": "bad", "op": "reports.summary", "params": {"start_date": "not-a-date"}},
+        {"id": "ok", "op": "reports.summary", "params": {}},
+    ], limiter=(store, "user:1"))
+    assert [r["status"] for r in results] == [422, 200]
+
+
+def test_batch_is_not_charged_without_the_limiter(db, user, batch_data):
+    results = _batch(db, user, [{"op": "reports.summary", "params": {}}] * 20)
+    assert all(r["status"] == 200 for r in results)
@@ -0,0 +1,96 @@
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+
+from app import models, schemas
+from app.routes.budgets import budget_progress
+from app.routes.categories import delete_category, update_category
+from app.routes.reports import summary_report
+
+
+def _closure(db):
+    return sorted(
+        (r.ancestor_id, r.descendant_id, r.depth) for r in db.query(models.CategoryClosure)
+    )
+
+
+def _move(db, user, category_id, parent_id):
+    return update_category(
+        category_id=category_id, payload=schemas.CategoryUpdate(parent_id=parent_id),
+        db=db, current_user=user,
+    )
+
+
+def test_create_builds_closure(db, make_category):
+    food = make_category("food")
+    groceries = make_category("groceries", parent_id=food.id)
+    veg = make_category("veg", parent_id=groceries.id)
+    assert _closure(db) == sorted([
+        (food.id, food.id, 0), (groceries.id, groceries.id, 0), (veg.id, veg.id, 0),
+        (food.id, groceries.id, 1), (groceries.id, veg.id, 1), (food.id, veg.id, 2),
+    ])
+
+
+def test_move_subtree(db, user, make_category):
+    food = make_category("food")
+    groceries = make_category("groceries", parent_id=food.id)
+    veg = make_category("veg", parent_id=groceries.id)
+    home = make_category("home")
+
+    _move(db, user, groceries.id, home.id)
+    assert _closure(db) == sorted([
+        (food.id, food.id, 0), (groceries.id, groceries.id, 0), (veg.id, veg.id, 0), (home.id, home.id, 0),
+        (home.id, groceries.id, 1), (groceries.id, veg.id, 1), (home.id, veg.id, 2),
+    ])
+
+    _move(db, user, groceries.id, None)
+    assert (home.id, veg.id, 2) not in _closure(db)
+    assert (groceries.id, veg.id, 1) in _closure(db)
+
+
+def test_cycles_are_rejected(db, user, make_category):
+    food = make_category("food")
+    groceries = make_category("groceries", parent_id=food.id)
+    veg = make_category("veg", parent_id=groceries.id)
+    before = _closure(db)
+
+    for parent in (veg.id, food.id):
+        with pytest.raises(HTTPException) as exc:
+            _move(db, user, food.id, parent)
+        assert exc.value.status_code == 400
+    assert _closure(db) == before
+
+
+def test_parent_must_share_type(make_category):
+    salary = make_category("salary", "income")
+    with pytest.raises(HTTPException) as exc:
+        make_category("food", "expense", parent_id=salary.id)
+    assert exc.value.status_code == 400
+
+
+def test_cannot_delete_category_with_children(db, user, make_category):
+    food = make_category("food")
+    make_category("groceries", parent_id=food.id)
+    with pytest.raises(HTTPException) as exc:
+        delete_category(category_id=food.id, db=db, current_user=user)
+    assert exc.value.status_code == 400
+
+
+def test_rollups_and_parent_budgets_cover_children(db, user, make_category, add_transaction):
+    food = make_category("food")
+    groceries = make_category("groceries", parent_id=food.id)
+    veg = make_category("veg", parent_id=groceries.id)
+    for cid, amount in ((food.id, 10), (groceries.id, 20), (veg.id, 5)):
+        add_transaction(cid, date(2025, 9, 10), amount)
+    db.add(models.Budget(user_id=user.id, month="2025-09", category_id=food.id, limit_amount=100))
+    db.commit()
+
+    flat = summary_report(db=db, current_user=user, start_date=None, end_date=None, rollup=False)
+    rolled = summary_report(db=db, current_user=user, start_date=None, end_date=None, rollup=True)
+    assert {r["name"]: r["total"] for r in flat["by_category"]} == {"food": 10, "groceries": 20, "veg": 5}
+    assert {r["name"]: r["total"] for r in rolled["by_category"]} == {"food": 35, "groceries": 25, "veg": 5}
+    assert flat["expense"] == rolled["expense"] == 35
+
+    progress = budget_progress(month="2025-09", category_id=food.id, db=db, current_user=user)
+    assert progress["spent"] == 35
@@ -0,0 +1,115 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from app import ledger, models, schemas
+from app.core.settings import settings
+from app.routes.budgets import budget_progress
+from app.routes.reports import summary_report
+from tests.conftest import rounded
+from app.routes.transactions import delete_transaction, update_transaction
+
+RANGES = [(None, None), (date(2025, 2, 10), date(2025, 5, 3)), (date(2025, 6, 1), date(2025, 6, 30))]
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(settings, "ledger_cache_mb", 16)
+    ledger.clear()
+    yield
+    ledger.clear()
+
+
+def _reports(db, user, food):
+    out = [
+        summary_report(db=db, current_user=user, start_date=s, end_date=e, rollup=rollup)
+        for s, e in RANGES for rollup in (False, True)
+    ]
+    out.append(budget_progress(month="2025-06", category_id=food.id, db=db, current_user=user))
+    return rounded(out)
+
+
+def _via_sql(db, user, food, monkeypatch):
+    with monkeypatch.context() as m:
+        m.setattr(settings, "ledger_cache_mb", 0)
+        return _reports(db, user, food)
+
+
+@pytest.fixture
+def ledger_data(db, user, make_category, add_transaction):
+    food = make_category("food")
+    groceries = make_category("groceries", parent_id=food.id)
+    salary = make_category("salary", "income")
+    cats = [food, groceries, salary]
+    rng = random.Random(7)
+    txs = [
+        add_transaction(rng.choice(cats).id, date(2025, 1, 1) + timedelta(days=rng.randrange(200)),
+             round(rng.uniform(1, 100), 2))
+        for _ in range(200)
+    ]
+    db.add(models.Budget(user_id=user.id, month="2025-06", category_id=food.id, limit_amount=500))
+    db.commit()
+    return food, groceries, txs
+
+
+def test_ledger_matches_sql_after_writes(db, user, cache, ledger_data, monkeypatch, add_transaction):
+    food, groceries, txs = ledger_data
+    assert _reports(db, user, food) == _via_sql(db, user, food, monkeypatch)
+    misses = ledger.cache_stats()["misses"]
+
+    add_transaction(groceries.id, date(2025, 6, 15), 12.34)
+    update_transaction(tx_id=txs[0].id, payload=schemas.TransactionUpdate(amount=99.99, tx_date=date(2025, 6, 2)),
+                       db=db, current_user=user)
+    update_transaction(tx_id=txs[1].id, payload=schemas.TransactionUpdate(category_id=groceries.id),
+                       db=db, current_user=user)
+    delete_transaction(tx_id=txs[2].id, db=db, current_user=user)
+
+    assert _reports(db, user, food) == _via_sql(db, user, food, monkeypatch)
+    stats = ledger.cache_stats()
+    # writes were applied as deltas, not rebuilds
+    assert stats["deltas"] >= 4
+    assert stats["misses"] == misses
+
+
+def test_write_from_another_worker_forces_rebuild(db, user, cache, ledger_data, monkeypatch):
+    food, groceries, _ = ledger_data
+    _reports(db, user, food)
+    misses = ledger.cache_stats()["misses"]
+
+    # another worker: bumps the version and writes, but can't touch our cache
+    db.add(models.Transaction(amount=50, tx_date=date(2025, 6, 20), user_id=user.id, category_id=food.id))
+    ledger.bump(db, user.id)
+    db.commit()
+
+    assert _reports(db, user, food) == _via_sql(db, user, food, monkeypatch)
+    assert ledger.cache_stats()["misses"] == misses + 1
+
+
+def test_oversize_snapshot_falls_back_to_sql(db, user, cache, ledger_data, monkeypatch):
+    food, _, _ = ledger_data
+    monkeypatch.setattr(ledger, "_budget", lambda: 100)
+    builds = []
+    real_build = ledger._build
+    monkeypatch.setattr(ledger, "_build", lambda *a: builds.append(1) or real_build(*a))
+
+    assert ledger.get_snapshot(db, user.id) is None
+    assert ledger.get_snapshot(db, user.id) is None
+    assert len(builds) == 1  # remembered, not rebuilt per request
+    stats = ledger.cache_stats()
+    assert stats["oversize"] == 2 and stats["users"] == 0
+    assert _reports(db, user, food) == _via_sql(db, user, food, monkeypatch)
+
+
+def test_bump_is_skipped_when_cache_is_off(db, user, make_category, add_transaction):
+    food = make_category("food")
+    add_transaction(food.id, date(2025, 1, 1), 1)
+    assert ledger.bump(db, user.id) is None
+    assert db.query(models.LedgerVersion).count() == 0
+
+
+def test_bump_upserts_version(db, user, cache):
+    assert ledger.bump(db, user.id) == 1
+    assert ledger.bump(db, user.id) == 2
+    db.commit()
+    assert db.get(models.LedgerVersion, user.id).version == 2
@@ -0,0 +1,98 @@
+import asyncio
+
+from app.core.ratelimit import RateLimitMiddleware, TokenBucketStore, charge, route_cost
+from app.core.security import create_access_token
+
+
+async def _ok_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+def _get(app, path, sub="1"):
+    token = create_access_token({"sub": sub})
+    scope = {
+        "type": "http", "method": "GET", "path": path,
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 1234),
+    }
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    start = sent[0]
+    return start["status"], dict(start["headers"])
+
+
+def test_reports_cost_more_than_lists():
+    assert route_cost("/reports/summary") == 5
+    assert route_cost("/budgets/progress") == 3
+    assert route_cost("/transactions/") == 1
+    assert route_cost("/reports/cache-stats") == 1
+
+
+def test_429_with_retry_after_once_bucket_is_empty():
+    app = RateLimitMiddleware(_ok_app, capacity=10, refill_per_sec=0.5)
+    assert _get(app, "/reports/summary")[0] == 200
+    assert _get(app, "/reports/summary")[0] == 200
+    status, headers = _get(app, "/transactions/")
+    assert status == 429
+    # one token short at 0.5 tokens/s -> wait about 2 s
+    assert headers[b"retry-after"] == b"2"
+
+
+def test_buckets_are_per_user():
+    app = RateLimitMiddleware(_ok_app, capacity=1, refill_per_sec=0.01)
+    assert _get(app, "/transactions/", sub="1")[0] == 200
+    assert _get(app, "/transactions/", sub="1")[0] == 429
+    assert _get(app, "/transactions/", sub="2")[0] == 200
+
+
+def test_cost_above_capacity_is_capped():
+    app = RateLimitMiddleware(_ok_app, capacity=3, refill_per_sec=1.0)
+    assert _get(app, "/reports/summary")[0] == 200
+
+
+def test_take_refills_over_time():
+    store = TokenBucketStore(capacity=2, refill_per_sec=1.0)
+    assert store.take("a", 2, now=0.0) == (True, 0.0)
+    allowed, retry_after = store.take("a", 1, now=0.5)
+    assert not allowed and retry_after == 0.5
+    assert store.take("a", 1, now=1.0)[0]
+
+
+def test_idle_buckets_are_evicted():
+    store = TokenBucketStore(capacity=2, refill_per_sec=1.0)  # idle_ttl = 2 s
+    store.take("a", 1, now=0.0)
+    store.take("b", 1, now=1.0)
+    assert len(store) == 2
+    store.take("c", 1, now=2.5)   # "a" idle for 2.5 s, already full again
+    assert len(store) == 2
+    store.take("d", 1, now=10.0)
+    assert len(store) == 1
+
+
+def test_bucket_count_is_bounded():
+    store = TokenBucketStore(capacity=100, refill_per_sec=1.0, max_buckets=3)
+    for i in range(10):
+        store.take(str(i), 1, now=0.0)
+    assert len(store) == 3
+
+
+def test_middleware_exposes_bucket_for_further_charges():
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen.update(scope)
+        await _ok_app(scope, receive, send)
+
+    limiter = RateLimitMiddleware(app, capacity=10, refill_per_sec=0.01)
+    _get(limiter, "/batch", sub="7")
+    assert charge(seen, "/reports/summary")[0]
+    assert charge(seen, "/reports/summary")[0] is False   # 1 + 5 already spent
+    assert charge({}, "/reports/summary") == (True, 0.0)
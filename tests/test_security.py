@@ -0,0 +1,77 @@
+import time
+
+import pytest
+from jose import jwt
+
+from app.core import security
+from app.core.security import ALGORITHM, SECRET_KEY, create_access_token, decode_access_token
+
+
+@pytest.fixture(autouse=True)
+def token_cache():
+    security.clear_token_cache()
+    yield security._token_cache
+    security.clear_token_cache()
+
+
+def test_valid_token_is_cached(token_cache):
+    token = create_access_token({"sub": "1"})
+    assert decode_access_token(token)["sub"] == "1"
+    assert len(token_cache) == 1
+    assert decode_access_token(token)["sub"] == "1"
+    assert len(token_cache) == 1
+
+
+def test_expired_cached_token_returns_none(token_cache, monkeypatch):
+    token = create_access_token({"sub": "1"})
+    assert decode_access_token(token) is not None
+    assert len(token_cache) == 1
+
+    later = time.time() + 2 * 3600
+    monkeypatch.setattr(security.time, "time", lambda: later)
+    monkeypatch.setattr(security, "_verify_token", lambda token: None)  # jose would reject it too
+    assert decode_access_token(token) is None
+    assert len(token_cache) == 0
+
+
+def test_bad_signature_is_not_cached(token_cache):
+    forged = jwt.encode({"sub": "1", "exp": time.time() + 3600}, "not-the-key", algorithm=ALGORITHM)
+    assert decode_access_token(forged) is None
+    assert decode_access_token(forged) is None
+    assert len(token_cache) == 0
+
+
+def test_token_without_exp_is_not_cached(token_cache):
+    token = jwt.encode({"sub": "1"}, SECRET_KEY, algorithm=ALGORITHM)
+    assert decode_access_token(token) == {"sub": "1"}
+    assert len(token_cache) == 0
+
+
+def test_cache_is_bounded_lru(token_cache, monkeypatch):
+    monkeypatch.setattr(security, "TOKEN_CACHE_SIZE", 3)
+    tokens = [create_access_token({"sub": str(i)}) for i in range(4)]
+    for token in tokens[:3]:
+        decode_access_token(token)
+    decode_access_token(tokens[0])   # now most recently used
+    decode_access_token(tokens[3])   # evicts tokens[1]
+    assert len(token_cache) == 3
+
+    calls = []
+    verify = security._verify_token
+    monkeypatch.setattr(security, "_verify_token", lambda t: calls.append(t) or verify(t))
+    for token in (tokens[0], tokens[2], tokens[3]):
+        decode_access_token(token)
+    assert calls == []
+    decode_access_token(tokens[1])
+    assert calls == [tokens[1]]
+    assert len(token_cache) == 3
+
+
+def test_cache_hit_returns_a_copy(token_cache):
+    token = create_access_token({"sub": "1", "role": "user"})
+    first = decode_access_token(token)
+    first["role"] = "admin"
+    hit = decode_access_token(token)
+    assert hit["role"] == "user"
+    hit["sub"] = "2"
+    assert decode_access_token(token)["sub"] == "1"
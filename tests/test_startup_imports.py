@@ -0,0 +1,34 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from app._startup import IMPORT_BUDGET_MS, LAZY_MODULES
+
+ROOT = Path(__file__).resolve().parents[1]
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+import main
+print(time.perf_counter() - start)
+print(" ".join(sys.modules))
+"""
+
+
+def _import_main():
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE], cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout.splitlines()
+    return float(out[0]) * 1000, out[1].split()
+
+
+def test_startup_keeps_heavy_modules_lazy():
+    _, modules = _import_main()
+    loaded = sorted(m for m in modules if m.split(".")[0] in LAZY_MODULES)
+    assert loaded == []
+
+
+def test_startup_import_time_budget():
+    # IMPORT_BUDGET_MS overrides the default budget
+    elapsed_ms, _ = _import_main()
+    assert elapsed_ms <= IMPORT_BUDGET_MS, f"import main took {elapsed_ms:.0f} ms"